@@ -0,0 +1 @@
+"""Example workflows, run as modules from the base of the repo. For example: python -m examples.budget_tracking."""
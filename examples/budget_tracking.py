@@ -1,30 +1,20 @@
 """This example shows how to perform a tag analysis for all tag-based transactions for the last 6 weeks."""
 
-# Import modules
-import os
-import sys
-from pathlib import Path
-
-# Append the base repo to the relative path, so that the local imports work as expected
-BASE_REPO_PATH = Path(os.path.abspath(__file__)).parents[1].as_posix()
-sys.path.append(BASE_REPO_PATH)
-
-# Local imports
-from src.helpers.up_toolkit import (  # noqa (import not at top)
+from src.helpers.up_toolkit import (
     perform_budget_versus_spend_tag_analysis,
 )
-from src.shared.logging.logger import InternalLogger  # noqa (import not at top)
-from src.shared.settings import DEFAULT_LOG_FILE, OUTPUT_DIR, TIMESTAMP, INPUT_DIR  # noqa (import not at top)
-from src.transformers.time_transformers import calculate_n_weeks_ago_to_timestamp  # noqa (import not at top)
+from src.shared.logging.logger import InternalLogger
+from src.shared.settings import DEFAULT_LOG_FILE, FILENAME_TIMESTAMP, INPUT_DIR, OUTPUT_DIR, TIMESTAMP
+from src.transformers.time_transformers import calculate_n_weeks_ago_to_timestamp
 
 # Setting logging level to informational
 log_level = "INFO"
-logger = InternalLogger(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="example_budget_tracker")
+logger = InternalLogger.get(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="example_budget_tracker")
 
 
 if __name__ == "__main__":
     timestamp_now = TIMESTAMP
-    timestamp_for_filename = TIMESTAMP.replace(":", "-")
+    timestamp_for_filename = FILENAME_TIMESTAMP
     # Retrieve the account that you want to perform the analysis on, in our example it's a 2Up Spending account
     account_name = "2Up Spending"
     # Generate a timestamp, so we can retrieve only the last six weeks of transactions
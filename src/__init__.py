@@ -0,0 +1 @@
+"""Uplift your banking toolkit source package."""
@@ -1,12 +1,42 @@
 from src.shared.logging.logger import InternalLogger  # noqa
-from src.shared.settings import DEFAULT_LOG_FILE, OUTPUT_DIR
+from src.shared.settings import DEFAULT_LOG_FILE, OUTPUT_DIR, OUTPUT_DIR_RESOLVED
+import numpy as np
 import pandas as pd
 import os
-from typing import Dict
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Set
 
 # Setting logging level to informational
 log_level = "INFO"
-logger = InternalLogger(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="exporters")
+logger = InternalLogger.get(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="exporters")
+
+# The number format applied to datetime cells in Excel workbooks.
+DEFAULT_EXCEL_DATETIME_FORMAT = "yyyy-mm-dd hh:mm:ss"
+# Excel limits, the maximum number of rows in a worksheet (excluding the header row) and length of a worksheet name.
+EXCEL_MAX_DATA_ROWS = 1_048_575
+EXCEL_MAX_WORKSHEET_NAME_LENGTH = 31
+
+
+def _build_output_file_path(output_dir: str, file_name: str) -> str:
+    """Build the absolute path of an output file.
+
+    Args:
+        output_dir: The output directory of the file.
+        file_name: The name of the file.
+
+    Returns:
+        file_path: The absolute path to the file.
+    """
+    # Re-use the already resolved output directory when the default is in use, rather than resolving it again.
+    # Otherwise, only fall back to resolving the path (which hits the filesystem) when it's a relative path.
+    if output_dir == OUTPUT_DIR:
+        output_dir_path = OUTPUT_DIR_RESOLVED
+    else:
+        output_dir_path = Path(output_dir)
+        if not output_dir_path.is_absolute():
+            output_dir_path = output_dir_path.resolve()
+    return os.fspath(output_dir_path / file_name)
 
 
 def export_to_csv(
@@ -14,6 +44,7 @@ def export_to_csv(
     file_name: str = "data.csv",
     output_dir: str = OUTPUT_DIR,
     index: bool = False,
+    engine: str = "pandas",
 ) -> str:
     """Export Pandas dataframe to a CSV file.
 
@@ -23,45 +54,384 @@ def export_to_csv(
         output_dir: The output directory of the CSV file where the Pandas dataframe will be saved
         to.
         index: Toggle whether the index is True or False
+        engine: The library used to write the CSV file, either "pandas" or "pyarrow".
+        NOTE: "pyarrow" writes the CSV file natively and is faster for large dataframes, but requires the optional
+        "pyarrow" extra to be installed.
+            Defaults to "pandas".
 
     Returns:
         file_path: The fully abstracted path to the CSV file.
 
     Raises:
-        N/A
+        ValueError: When an unsupported engine is supplied.
+        ImportError: When the "pyarrow" engine is selected, but pyarrow is not installed.
     """
-    file_path = os.path.abspath(os.path.join(output_dir, file_name))
-    df.to_csv(file_path, index=index)
+    file_path = _build_output_file_path(output_dir=output_dir, file_name=file_name)
+    if engine == "pandas":
+        df.to_csv(file_path, index=index)
+    elif engine == "pyarrow":
+        # Imported here, as pyarrow is an optional dependency which is only required for this engine.
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError as import_err:
+            error_message = (
+                "The 'pyarrow' CSV engine requires pyarrow, which is not installed. Please install the 'pyarrow' "
+                "extra (poetry install --extras pyarrow) or use the 'pandas' engine."
+            )
+            logger.critical(error_message)
+            raise ImportError(error_message) from import_err
+
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=index), file_path)
+    else:
+        error_message = f"Unsupported CSV engine: {engine}. Please use either 'pandas' or 'pyarrow'."
+        logger.critical(error_message)
+        raise ValueError(error_message)
     logger.info(f"CSV file saved to: {file_path}")
     return file_path
 
 
+def output_dfs_to_csv(
+    df_list: Dict[str, pd.DataFrame],
+    output_dir: str = OUTPUT_DIR,
+    filename_prefix: str = "example_file",
+    engine: str = "pandas",
+) -> List[str]:
+    """Save a list of pandas dataframes to CSV files, one CSV file per dataframe.
+
+    This is a faster alternative to output_dfs_to_excel for large reports, when an Excel workbook is not required.
+
+    Args:
+        df_list: Key-value representation of the report name and the pandas dataframe to be saved to a CSV file.
+        output_dir: The output directory of where the CSV files will be saved.
+            Defaults to OUTPUT_DIR.
+        filename_prefix: The prefix of each CSV filename, which will be suffixed with the report name.
+            Example: A filename_prefix of "budget_vs_spend" and a report name of "report_summary" will be saved to
+            "budget_vs_spend-report_summary.csv".
+            Defaults to "example_file".
+        engine: The library used to write the CSV files, either "pandas" or "pyarrow". See export_to_csv.
+            Defaults to "pandas".
+
+    Returns:
+        csv_files: The location of each CSV file.
+    """
+    csv_files: List[str] = []
+    for report_name, df in df_list.items():
+        csv_file = export_to_csv(
+            df=df, file_name=f"{filename_prefix}-{report_name}.csv", output_dir=output_dir, engine=engine
+        )
+        csv_files.append(csv_file)
+    return csv_files
+
+
 def output_dfs_to_excel(
-    df_list: Dict[str, pd.DataFrame], output_dir: str = OUTPUT_DIR, filename: str = "example_file.xlsx"
+    df_list: Dict[str, pd.DataFrame],
+    output_dir: str = OUTPUT_DIR,
+    filename: str = "example_file.xlsx",
+    engine: str = "xlsxwriter",
+    segment_size: int = EXCEL_MAX_DATA_ROWS,
 ) -> str:
     """Save a list of pandas dataframes to an Excel workbook.
 
     Args:
         df_list: Key-value representation of the worksheet_name and the pandas dataframe to be saved to the workbook.
+        NOTE: Each dataframe is removed from df_list once it has been written to the workbook, so that its memory
+        can be reclaimed before the next worksheet is written. Pass in a copy (e.g. dict(df_list)) if the
+        dataframes are still required afterwards.
         output_dir: The output directory of where the Excel file will be saved.
             Defaults to dirname.
         filename: The name of the Excel file.
             Defaults to "example_file.xlsx".
+        engine: The library used to write the Excel file, either "xlsxwriter" or "pyexcelerate".
+        NOTE: "pyexcelerate" writes each worksheet as a single bulk range, but requires the optional "pyexcelerate"
+        extra to be installed.
+            Defaults to "xlsxwriter".
+        segment_size: The maximum number of rows to be written to a single worksheet. Any dataframe with more rows
+        is split across multiple worksheets, suffixed with "_part<n>".
+            Defaults to EXCEL_MAX_DATA_ROWS, the maximum number of rows (excluding the header) that Excel supports.
 
     Returns:
         excel_file: The location of the Excel file.
+
+    Raises:
+        ValueError: When an unsupported engine or segment_size is supplied.
+        ImportError: When the "pyexcelerate" engine is selected, but pyexcelerate is not installed.
     """
+    if not 0 < segment_size <= EXCEL_MAX_DATA_ROWS:
+        error_message = f"Unsupported segment size: {segment_size}. Please use a value from 1 to {EXCEL_MAX_DATA_ROWS}."
+        logger.critical(error_message)
+        raise ValueError(error_message)
     # Assign Excel file a variable name
-    excel_file = os.path.join(output_dir, filename)
+    excel_file = _build_output_file_path(output_dir=output_dir, file_name=filename)
+    if any(len(df.index) > segment_size for df in df_list.values()):
+        df_list = _segment_dfs(df_list=df_list, segment_size=segment_size)
+    if engine == "xlsxwriter":
+        _write_workbook(excel_file=excel_file, df_list=df_list)
+    elif engine == "pyexcelerate":
+        _write_workbook_pyexcelerate(excel_file=excel_file, df_list=df_list)
+    else:
+        error_message = f"Unsupported Excel engine: {engine}. Please use either 'xlsxwriter' or 'pyexcelerate'."
+        logger.critical(error_message)
+        raise ValueError(error_message)
+    # Diagnostic printout
+    logger.info(f"Excel results are available at: {excel_file}")
+    return excel_file
+
+
+def _segment_dfs(df_list: Dict[str, pd.DataFrame], segment_size: int) -> Dict[str, pd.DataFrame]:
+    """Split any pandas dataframe with more rows than the segment size into multiple, numbered dataframes.
+
+    Args:
+        df_list: Key-value representation of the worksheet_name and the pandas dataframe to be saved to the workbook.
+        NOTE: Each dataframe is removed from df_list as it is segmented.
+        segment_size: The maximum number of rows in a single dataframe.
+
+    Returns:
+        segmented_df_list: Key-value representation of the worksheet_name and the pandas dataframe, whereby oversized
+        dataframes are split into worksheets named "<worksheet_name>_part<n>".
+    """
+    segmented_df_list: Dict[str, pd.DataFrame] = {}
+    # Track the worksheet names in use, so that the segmented worksheet names never clash with another worksheet.
+    # NOTE: Excel compares worksheet names case-insensitively, so they're tracked in lower case.
+    reserved_worksheet_names = {worksheet_name.lower() for worksheet_name in df_list}
+    while df_list:
+        worksheet_name = next(iter(df_list))
+        df = df_list.pop(worksheet_name)
+        if len(df.index) <= segment_size:
+            segmented_df_list[worksheet_name] = df
+            continue
+        for part_number, start_row in enumerate(range(0, len(df.index), segment_size), start=1):
+            part_name = _build_segment_worksheet_name(
+                worksheet_name=worksheet_name,
+                part_number=part_number,
+                reserved_worksheet_names=reserved_worksheet_names,
+            )
+            segmented_df_list[part_name] = df.iloc[start_row : start_row + segment_size]
+            logger.info(f"Segmenting worksheet: {worksheet_name} into {part_name}")
+    return segmented_df_list
+
+
+def _build_segment_worksheet_name(worksheet_name: str, part_number: int, reserved_worksheet_names: Set[str]) -> str:
+    """Build a unique worksheet name for a segment of a worksheet, which fits within Excel's worksheet name limit.
+
+    Args:
+        worksheet_name: The name of the worksheet being segmented.
+        part_number: The number of the segment.
+        reserved_worksheet_names: The lower case worksheet names already in use.
+        NOTE: The returned worksheet name is added to the reserved worksheet names.
+
+    Returns:
+        part_name: The worksheet name of the segment, "<worksheet_name>_part<n>". When that is already in use, a
+        counter is added ("<worksheet_name>_part<n>_<counter>") until it is unique.
+    """
+    suffix = f"_part{part_number}"
+    counter = 1
+    while True:
+        # Truncate the worksheet name, so that the suffix always fits within Excel's worksheet name limit.
+        part_name = f"{worksheet_name[: EXCEL_MAX_WORKSHEET_NAME_LENGTH - len(suffix)]}{suffix}"
+        if part_name.lower() not in reserved_worksheet_names:
+            reserved_worksheet_names.add(part_name.lower())
+            return part_name
+        counter += 1
+        suffix = f"_part{part_number}_{counter}"
+
+
+def _write_workbook(excel_file: str, df_list: Dict[str, pd.DataFrame]) -> None:
+    """Write each pandas dataframe to its own worksheet within a single Excel workbook.
+
+    NOTE: This is kept separate to output_dfs_to_excel, so that the workbook writer can be swapped out without
+    changing the public signature of the exporter.
+
+    Args:
+        excel_file: The full path of the Excel file to be written.
+        df_list: Key-value representation of the worksheet_name and the pandas dataframe to be saved to the workbook.
+        NOTE: Each dataframe is removed from df_list once it has been written to the workbook.
+
+    Returns:
+        N/A
+    """
     # Create a Pandas Excel writer using XlsxWriter as the engine.
-    writer = pd.ExcelWriter(excel_file, engine="xlsxwriter")
+    # NOTE: constant_memory flushes each row to disk as soon as the next row is started, rather than buffering the
+    # entire workbook in memory. The trade-off is that rows MUST be written in order, and any column/worksheet
+    # level settings (widths, autofilters etc.) must be applied before the first row is written.
+    # NOTE: strings_to_urls is disabled, as otherwise every string containing a colon (e.g. every timestamp string)
+    # is run through a handful of regular expressions to check whether it should be written as a hyperlink.
+    writer = pd.ExcelWriter(
+        excel_file,
+        engine="xlsxwriter",
+        engine_kwargs={
+            "options": {
+                "constant_memory": True,
+                "remove_timezone": True,
+                "strings_to_urls": False,
+                "default_date_format": DEFAULT_EXCEL_DATETIME_FORMAT,
+            }
+        },
+    )
+    workbook = writer.book
+    # Matches the header format that df.to_excel applies.
+    header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    # Create the datetime format once, and share it across every datetime column in the workbook.
+    datetime_format = workbook.add_format({"num_format": DEFAULT_EXCEL_DATETIME_FORMAT})
     # Iterate over worksheet name (the dict key) and the pandas dataframe (the dict value) and
     # save the dataframe to a new worksheet
-    for worksheet_name, df in df_list.items():
+    # NOTE: Worksheets are deliberately written sequentially. An xlsx file can only be produced by a single writer, so
+    # writing worksheets from separate processes would mean re-reading and merging every part into one workbook
+    # afterwards, which costs more than it saves at the report sizes this toolkit produces.
+    while df_list:
+        # Pop each dataframe off in insertion order, so it can be released as soon as its worksheet is written.
+        worksheet_name = next(iter(df_list))
+        df = df_list.pop(worksheet_name)
         logger.info(f"Saving worksheet: {worksheet_name}")
-        df.to_excel(writer, sheet_name=worksheet_name, index=False)
+        worksheet = workbook.add_worksheet(worksheet_name)
+        # NOTE: df.to_excel emits cells column by column, which is incompatible with constant_memory (only the last
+        # row would survive), so the header and rows are written out row by row instead.
+        worksheet.write_row(0, 0, df.columns.tolist(), header_format)
+        # Empty dataframes (e.g. no untagged withdrawals) only need the header row, so skip the row writing entirely.
+        if len(df.index) == 0:
+            logger.info(f"Skipping empty worksheet rows: {worksheet_name}")
+            continue
+        # Strip any timezones once per column, rather than having xlsxwriter do it for every cell.
+        df = _remove_datetime_timezones(df=df)
+        # Resolve the cell writer once per column, rather than letting xlsxwriter work out the type of every cell.
+        # Numeric and datetime columns without any missing or infinite values can go straight to
+        # write_number/write_datetime, everything else uses the generic write method.
+        # NOTE: The columns are iterated by position, as a dataframe may contain more than one column with the same
+        # name.
+        column_writers: List[Callable[..., int]] = []
+        for _, series in df.items():
+            if series.hasnans or _has_infinite_values(series=series):
+                column_writers.append(worksheet.write)
+            elif pd.api.types.is_datetime64_dtype(series):
+                column_writers.append(partial(worksheet.write_datetime, cell_format=datetime_format))
+            elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                column_writers.append(worksheet.write_number)
+            else:
+                column_writers.append(worksheet.write)
+        values = _convert_df_to_cell_values(df=df)
+        for row_number, row in enumerate(values.tolist(), start=1):
+            for column_number, (write_cell, value) in enumerate(zip(column_writers, row, strict=True)):
+                write_cell(row_number, column_number, value)
+        # Release the worksheet's data before moving onto the next one.
+        del df, values
     # Close the Pandas Excel writer and output the Excel file.
     writer.close()
-    # Diagnostic printout
-    logger.info(f"Excel results are available at: {excel_file}")
-    return excel_file
+
+
+def _write_workbook_pyexcelerate(excel_file: str, df_list: Dict[str, pd.DataFrame]) -> None:
+    """Write each pandas dataframe to its own worksheet within a single Excel workbook, using pyexcelerate.
+
+    Each worksheet is handed to pyexcelerate as one range of rows (header included), rather than cell by cell.
+
+    Args:
+        excel_file: The full path of the Excel file to be written.
+        df_list: Key-value representation of the worksheet_name and the pandas dataframe to be saved to the workbook.
+        NOTE: Each dataframe is removed from df_list once it has been written to the workbook.
+
+    Returns:
+        N/A
+
+    Raises:
+        ImportError: When pyexcelerate is not installed.
+    """
+    # Imported here, as pyexcelerate is an optional dependency which is only required for this engine.
+    try:
+        from pyexcelerate import Format, Style, Workbook
+    except ImportError as import_err:
+        error_message = (
+            "The 'pyexcelerate' Excel engine requires pyexcelerate, which is not installed. Please install the "
+            "'pyexcelerate' extra (poetry install --extras pyexcelerate) or use the 'xlsxwriter' engine."
+        )
+        logger.critical(error_message)
+        raise ImportError(error_message) from import_err
+
+    workbook = Workbook()
+    datetime_style = Style(format=Format(DEFAULT_EXCEL_DATETIME_FORMAT))
+    while df_list:
+        # Pop each dataframe off in insertion order, so it can be released as soon as its worksheet is written.
+        worksheet_name = next(iter(df_list))
+        df = df_list.pop(worksheet_name)
+        logger.info(f"Saving worksheet: {worksheet_name}")
+        worksheet = workbook.new_sheet(worksheet_name, data=_convert_df_to_rows(df=df))
+        # Apply a datetime format to the datetime columns, otherwise they are displayed as plain numbers.
+        # NOTE: pyexcelerate columns are 1-indexed.
+        for column_number, column_dtype in enumerate(df.dtypes, start=1):
+            if pd.api.types.is_datetime64_any_dtype(column_dtype):
+                worksheet.set_col_style(column_number, datetime_style)
+    workbook.save(excel_file)
+
+
+def _convert_df_to_rows(df: pd.DataFrame) -> List[List[Any]]:
+    """Convert a pandas dataframe into a list of rows made up of native Python values, headed by the column names.
+
+    Args:
+        df: The pandas dataframe to be converted.
+
+    Returns:
+        rows: The header row, followed by a row for each record in the dataframe.
+    """
+    df = _remove_datetime_timezones(df=df)
+    rows: List[List[Any]] = [df.columns.tolist()]
+    rows.extend(_convert_df_to_cell_values(df=df).tolist())
+    return rows
+
+
+def _has_infinite_values(series: pd.Series) -> bool:
+    """Check whether a pandas series contains any positive or negative infinite values.
+
+    Args:
+        series: The pandas series to be checked.
+
+    Returns:
+        has_infinite_values: True if the series is a float series containing +/-inf, otherwise False.
+    """
+    if not pd.api.types.is_float_dtype(series):
+        return False
+    return bool(np.isinf(series.to_numpy(dtype=np.float64, na_value=np.nan)).any())
+
+
+def _convert_df_to_cell_values(df: pd.DataFrame) -> np.ndarray:
+    """Convert a pandas dataframe into a 2D object array of the values to be written to each Excel cell.
+
+    NaN/NaT are replaced with None, so that they are written as blank cells, and +/-inf are replaced with "inf"/"-inf",
+    as Excel has no representation of infinity. Both match the defaults of df.to_excel (na_rep and inf_rep).
+
+    Args:
+        df: The pandas dataframe to be converted.
+
+    Returns:
+        values: The cell values, with a row for each record in the dataframe.
+    """
+    values: np.ndarray = df.to_numpy(dtype=object)
+    values[pd.isna(values)] = None
+    for column_number in range(df.shape[1]):
+        series = df.iloc[:, column_number]
+        if _has_infinite_values(series=series):
+            column_values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            values[column_values == np.inf, column_number] = "inf"
+            values[column_values == -np.inf, column_number] = "-inf"
+    return values
+
+
+def _remove_datetime_timezones(df: pd.DataFrame) -> pd.DataFrame:
+    """Remove the timezone from any timezone-aware datetime columns, as Excel has no concept of timezones.
+
+    Args:
+        df: The pandas dataframe to be converted.
+
+    Returns:
+        df: The pandas dataframe with timezone-naive datetime columns. NOTE: The original dataframe is not modified.
+    """
+    # NOTE: The columns are located by position, as a dataframe may contain more than one column with the same name.
+    datetime_column_numbers = [
+        column_number
+        for column_number, column_dtype in enumerate(df.dtypes)
+        if isinstance(column_dtype, pd.DatetimeTZDtype)
+    ]
+    if not datetime_column_numbers:
+        return df
+    # A shallow copy is sufficient, as each column is replaced rather than modified.
+    df = df.copy(deep=False)
+    for column_number in datetime_column_numbers:
+        df.isetitem(column_number, df.iloc[:, column_number].dt.tz_localize(None))
+    return df
@@ -1,31 +1,42 @@
 """Up toolkit helpers."""
 
 # Import modules
+import logging
 import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import pandas as pd
 from upbankapi import Client, NotAuthorizedException
 from upbankapi.models import PaginatedList, Transaction
 from upbankapi.models.accounts import Account
 
-from src.exporters.outputs import output_dfs_to_excel
+from src.exporters.outputs import EXCEL_MAX_DATA_ROWS, output_dfs_to_excel
 from src.ingestors.budget_ingestors import load_csv_budget_to_df
 from src.shared.logging.logger import InternalLogger  # noqa
-from src.shared.settings import DEFAULT_LOG_FILE, DEFAULT_TIMESTAMP_FORMAT, OUTPUT_DIR, TIMESTAMP
+from src.shared.settings import DEFAULT_LOG_FILE, DEFAULT_TIMESTAMP_FORMAT, DEFAULT_TIMEZONE, OUTPUT_DIR, TIMESTAMP
 from src.transformers.data_transformers import (
+    calculate_total_spend_by_tag,
     calculate_weekly_budget_variance,
     convert_transactions_to_df,
-    filter_transactions_by_tag,
-    filter_transactions_by_withdrawals_only,
-    filter_transactions_with_empty_tag,
+    filter_transactions_by_untagged_withdrawals,
 )
 from src.transformers.time_transformers import calculate_time_periods_between_two_dates
 
 # Setting logging level to informational
 log_level = "INFO"
-logger = InternalLogger(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="up_helpers")
+logger = InternalLogger.get(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="up_helpers")
+
+# The columns of the report summary worksheet, which is included in every report.
+REPORT_SUMMARY_COLUMNS: List[str] = [
+    "from_timestamp",
+    "to_timestamp",
+    "generated_at",
+    "total_days",
+    "total_weeks",
+    "total_months",
+]
 
 
 def initialise_up_bank_client(token: str = "") -> Client:  # nosec (hardcoded password)
@@ -42,10 +53,10 @@ def initialise_up_bank_client(token: str = "") -> Client:  # nosec (hardcoded pa
     up_bank_client = Client(token=token) if token else Client()
     try:
         user_id = up_bank_client.ping()
-        logger.info(f"Authorized: {user_id}")
+        logger.info("Authorized: %s", user_id)
         return up_bank_client
     except NotAuthorizedException as not_auth_err:
-        logger.critical(f"The token is invalid. Error: {not_auth_err}. Please check your token and try again.")
+        logger.critical("The token is invalid. Error: %s. Please check your token and try again.", not_auth_err)
         sys.exit(2)
 
 
@@ -60,11 +71,13 @@ def retrieve_specific_account(account_id: str, up_bank_client: Client) -> Accoun
     Returns:
         up_bank_account: An Up Account, ready for future processing.
     """
-    logger.info(f"Retrieving account ID: {account_id}")
+    logger.info("Retrieving account ID: %s", account_id)
     up_bank_account: Account = up_bank_client.account(account_id)
     logger.info(
-        f"Account ID: {account_id} retrieved. Account Name: {up_bank_account.name} "
-        f"- Ownership Type: {up_bank_account.ownership_type}"
+        "Account ID: %s retrieved. Account Name: %s - Ownership Type: %s",
+        account_id,
+        up_bank_account.name,
+        up_bank_account.ownership_type,
     )
     return up_bank_account
 
@@ -90,10 +103,10 @@ def retrieve_transactions_from_account(
         all_transactions: A list of transactions, ready for future processing.
     """
     if transaction_limit:
-        logger.info(f"Retrieving last {transaction_limit} transactions for {up_bank_account.name}")
-    logger.info(f"Retrieving transactions for account name: {up_bank_account.name}")
+        logger.info("Retrieving last %s transactions for %s", transaction_limit, up_bank_account.name)
+    logger.info("Retrieving transactions for account name: %s", up_bank_account.name)
     all_transactions = up_bank_account.transactions(limit=transaction_limit, since=since, until=until)
-    logger.info(f"Retrieved transactions for account name: {up_bank_account.name}")
+    logger.info("Retrieved transactions for account name: %s", up_bank_account.name)
     return all_transactions
 
 
@@ -107,18 +120,53 @@ def filter_by_account_name(up_bank_client: Client, account_name: str) -> Account
     Returns:
         account: An Up Account, ready for processing.
     """
+    # NOTE: The accounts are a lazily paginated list, so searching it directly stops fetching pages at the first
+    # account matching the account name.
     accounts = up_bank_client.accounts()
-    account_names: List[str] = []
-    for account in accounts:
-        account_names.append(account.name)
-        if account.name == account_name:
-            return account
-    logger.error(
-        f"Unable to find account name: {account_name} "
-        f"in list of accounts: {account_names}."
-        " Please check the account name and try again."
-    )
-    return None
+    matched_account = next((account for account in accounts if account.name == account_name), None)
+    if matched_account is None:
+        # Only build the list of account names when there's no match and it's needed for the error message. By this
+        # point every page has been fetched, so this re-uses the accounts already loaded by the paginated list.
+        account_names = [account.name for account in accounts]
+        logger.error(
+            "Unable to find account name: %s in list of accounts: %s. Please check the account name and try again.",
+            account_name,
+            account_names,
+        )
+    return matched_account
+
+
+class AccountContext(NamedTuple):
+    """An initialised Up Bank client, and an account retrieved using that client."""
+
+    client: Client
+    account: Account
+
+
+@lru_cache(maxsize=8)
+def _get_account_context(account_name: str) -> AccountContext:
+    """Initialise the Up Bank client and retrieve the account matching the account name.
+
+    NOTE: The result is cached per account name, so that running multiple analyses against the same account only
+    validates the token and looks up the account once.
+
+    Args:
+        account_name: The account name to be retrieved.
+
+    Returns:
+        account_context: The initialised Up Bank client and the retrieved Up Account.
+    """
+    up_bank_client = initialise_up_bank_client()
+    account_data = filter_by_account_name(up_bank_client=up_bank_client, account_name=account_name)
+    if not account_data:
+        logger.critical(
+            "Unable to retrieve account name: %s and it's account_id attribute."
+            " Please check that your account name is correct and try again.",
+            account_name,
+        )
+        sys.exit(2)
+    up_bank_account = retrieve_specific_account(account_id=account_data.id, up_bank_client=up_bank_client)
+    return AccountContext(client=up_bank_client, account=up_bank_account)
 
 
 def convert_datetime_to_string(date_object: datetime, timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT) -> str:
@@ -140,14 +188,270 @@ def convert_datetime_to_string(date_object: datetime, timestamp_format: str = DE
         return datetime_as_string
 
 
+def _format_datetime_column(series: pd.Series, timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT) -> pd.Series:
+    """Convert a column of datetime objects to strings in a single vectorised pass.
+
+    This is the column-wide equivalent of convert_datetime_to_string.
+
+    Args:
+        series: The column of datetime objects, to be converted to strings.
+        timestamp_format: The timestamp format to be used in the string conversion.
+
+    Returns:
+        datetime_strings: The column of datetime objects in string format, as per the supplied timestamp_format.
+        Empty values are returned as an empty string.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(series):
+        # NOTE: Datetimes with mixed UTC offsets (e.g. either side of a daylight savings change) are stored as objects,
+        # so convert them to the default timezone, which is the timezone the Up API reports in.
+        series = pd.to_datetime(series, errors="coerce", utc=True).dt.tz_convert(DEFAULT_TIMEZONE)
+    datetime_strings = series.dt.strftime(timestamp_format).fillna("")
+    return datetime_strings
+
+
+def convert_timestamp_to_datetime(
+    timestamp: str | datetime, timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT
+) -> datetime:
+    """Convert a timestamp string to a datetime object, passing through timestamps which are already datetime objects.
+
+    This allows a timestamp to be parsed once by the caller, and then shared across multiple analysis functions.
+
+    Args:
+        timestamp: The timestamp, either as a string in the timestamp_format or an already parsed datetime object.
+        timestamp_format: The timestamp format of the timestamp, when supplied as a string.
+            Defaults to DEFAULT_TIMESTAMP_FORMAT.
+
+    Returns:
+        timestamp_as_datetime: The timestamp as a datetime object.
+    """
+    if isinstance(timestamp, datetime):
+        return timestamp
+    timestamp_as_datetime = datetime.strptime(timestamp, timestamp_format)
+    return timestamp_as_datetime
+
+
+class ReportPeriod(NamedTuple):
+    """The start and end time of a report, and the time periods between them."""
+
+    start_time: datetime
+    end_time: datetime
+    days: float
+    weeks: float
+    months: float
+    # NOTE: The inverse of the weeks and months are precomputed, so that spend can be converted into weekly and
+    # monthly spend by multiplying, rather than dividing.
+    inverse_weeks: float
+    inverse_months: float
+
+
+@lru_cache(maxsize=32)
+def _parse_period(
+    start_timestamp: str | datetime, end_timestamp: str | datetime, timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT
+) -> ReportPeriod:
+    """Parse the start and end timestamps of a report, and calculate the time periods between them.
+
+    The result is cached, so that multiple reports over the same period only parse the timestamps once.
+
+    Args:
+        start_timestamp: The start timestamp, either as a string in the timestamp_format or an already parsed
+        datetime object.
+        end_timestamp: The end timestamp, either as a string in the timestamp_format or an already parsed datetime
+        object.
+        timestamp_format: The timestamp format of the timestamps, when supplied as strings.
+            Defaults to DEFAULT_TIMESTAMP_FORMAT.
+
+    Returns:
+        report_period: The start and end time of the report, and the time periods between them.
+    """
+    start_time = convert_timestamp_to_datetime(timestamp=start_timestamp, timestamp_format=timestamp_format)
+    end_time = convert_timestamp_to_datetime(timestamp=end_timestamp, timestamp_format=timestamp_format)
+    days, weeks, months = calculate_time_periods_between_two_dates(start_time=start_time, end_time=end_time)
+    # NOTE: A report over an empty period (the start and end time are the same) has no weeks or months to divide the
+    # spend by. Its inverse is infinite, which matches dividing the spend by zero.
+    return ReportPeriod(
+        start_time=start_time,
+        end_time=end_time,
+        days=days,
+        weeks=weeks,
+        months=months,
+        inverse_weeks=1.0 / weeks if weeks else float("inf"),
+        inverse_months=1.0 / months if months else float("inf"),
+    )
+
+
+def _build_report_summary(report_period: ReportPeriod, timestamp_format: str, generated_timestamp: str) -> pd.DataFrame:
+    """Build the report summary dataframe, which describes the period a report covers and when it was generated.
+
+    Args:
+        report_period: The period the report covers.
+        timestamp_format: The timestamp format to present the start and end time in.
+        generated_timestamp: The timestamp which should be added for reporting purposes, so we know when the
+        report was triggered.
+
+    Returns:
+        report_summary_df: The single row report summary dataframe.
+    """
+    report_summary_df = pd.DataFrame(
+        [
+            (
+                report_period.start_time.strftime(timestamp_format),
+                report_period.end_time.strftime(timestamp_format),
+                generated_timestamp,
+                report_period.days,
+                report_period.weeks,
+                report_period.months,
+            )
+        ],
+        columns=REPORT_SUMMARY_COLUMNS,
+    )
+    return report_summary_df
+
+
+def _compute_tag_summary(
+    up_bank_account: Account,
+    report_period: ReportPeriod,
+    tags_to_be_analysed: Optional[List[str]] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Compute the tag spend summary for an account over the specified time period.
+
+    NOTE: The transactions are returned as they are, so only the reports which write out each tag's transactions pay
+    for formatting and splitting them up (see _split_transactions_by_tag).
+
+    Args:
+        up_bank_account: An Up Account, ready for processing.
+        report_period: The period to perform the analysis on.
+        tags_to_be_analysed: An optional list of tags to limit the analysis to. When not supplied, all tags are
+        analysed.
+            Defaults to None.
+
+    Returns:
+        all_tag_summary_df: The summary dataframe which contains the tag spend summary, sorted by the total spend.
+        all_transactions_df: The transactions the summary was computed from.
+    """
+    # Pass the transactions straight through to the conversion, so the transaction objects can be released as soon
+    # as they've been converted into the dataframe's columns.
+    all_transactions_df = convert_transactions_to_df(
+        up_bank_transactions=retrieve_transactions_from_account(
+            up_bank_account=up_bank_account, since=report_period.start_time, until=report_period.end_time
+        )
+    )
+    if tags_to_be_analysed is not None:
+        # Only keep the transactions for the tags being analysed, so the remaining steps only process the relevant
+        # rows.
+        all_transactions_df = all_transactions_df[all_transactions_df["tags"].isin(tags_to_be_analysed)]
+    total_tag_spend = calculate_total_spend_by_tag(df=all_transactions_df)
+    if tags_to_be_analysed is not None:
+        # NOTE: Tags without any transactions are still reported on, with a total spend of 0.
+        total_tag_spend = total_tag_spend.reindex(tags_to_be_analysed, fill_value=0.0)
+    # Build the summary directly from the aligned arrays of the per-tag totals, rather than from per-tag records.
+    total_tag_spend_values = total_tag_spend.to_numpy()
+    all_tag_summary_df = pd.DataFrame(
+        {
+            "tag": total_tag_spend.index.to_numpy(dtype=object),
+            "total_spend": total_tag_spend_values,
+            "weekly_spend": total_tag_spend_values * report_period.inverse_weeks,
+            "monthly_spend": total_tag_spend_values * report_period.inverse_months,
+        }
+    )
+    # NOTE: Converting the summary into records is only worthwhile when the message is actually going to be logged.
+    if logger.logger.isEnabledFor(logging.INFO):
+        logger.info("Tag analysis data: %s", all_tag_summary_df.to_dict(orient="records"))
+    all_tag_summary_df = all_tag_summary_df.sort_values(by=["total_spend"], ascending=False)
+    return all_tag_summary_df, all_transactions_df
+
+
+def _split_transactions_by_tag(
+    all_transactions_df: pd.DataFrame,
+    timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT,
+    tags_to_be_analysed: Optional[List[str]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """Split the transactions into a dataframe per tag, ready to be written to a report.
+
+    Args:
+        all_transactions_df: The transactions to be split, as returned by _compute_tag_summary.
+        timestamp_format: The timestamp format to convert the transactions' datetimes to.
+            Defaults to DEFAULT_TIMESTAMP_FORMAT.
+        tags_to_be_analysed: An optional list of tags the analysis was limited to. When supplied, every one of these
+        tags is returned (in the same order), even when it has no transactions.
+            Defaults to None.
+
+    Returns:
+        tag_specific_df_results: A dictionary of each tag's transactions, keyed by the tag.
+    """
+    # Convert the datetimes to strings once for all transactions, rather than once per tag.
+    all_transactions_df = all_transactions_df.assign(
+        settled_at=_format_datetime_column(all_transactions_df["settled_at"], timestamp_format=timestamp_format),
+        created_at=_format_datetime_column(all_transactions_df["created_at"], timestamp_format=timestamp_format),
+    )
+    # Group the transactions by tag once, rather than scanning all the transactions once per tag.
+    grouped_transactions = all_transactions_df.groupby("tags", sort=False, observed=True)
+    tag_specific_df_results: Dict[str, pd.DataFrame] = dict(iter(grouped_transactions))
+    if tags_to_be_analysed is not None:
+        tag_specific_df_results = {
+            tag: tag_specific_df_results.get(tag, all_transactions_df.iloc[0:0]) for tag in tags_to_be_analysed
+        }
+    return tag_specific_df_results
+
+
+def _write_tag_report(
+    all_tag_summary_df: pd.DataFrame,
+    all_transactions_df: pd.DataFrame,
+    report_period: ReportPeriod,
+    timestamp_format: str,
+    generated_timestamp: str,
+    output_dir: str,
+    output_filename: str,
+    tags_to_be_analysed: Optional[List[str]] = None,
+    segment_size: int = EXCEL_MAX_DATA_ROWS,
+) -> str:
+    """Write the tag spend summary and the per-tag transactions to an Excel report.
+
+    Args:
+        all_tag_summary_df: The summary dataframe which contains the tag spend summary.
+        all_transactions_df: The transactions the summary was computed from, which are written out per tag.
+        report_period: The period the analysis was performed on.
+        timestamp_format: The timestamp format to present the start and end time in.
+        generated_timestamp: The timestamp which should be added for reporting purposes, so we know when the
+        report was triggered.
+        output_dir: The output directory to save the report to.
+        output_filename: The output filename to save the report to.
+        tags_to_be_analysed: An optional list of tags the analysis was limited to, which each get a worksheet.
+            Defaults to None.
+        segment_size: The maximum number of transactions to be written to a single worksheet.
+            Defaults to EXCEL_MAX_DATA_ROWS.
+
+    Returns:
+        report_file: The Excel report file path which contains the results.
+    """
+    report_summary_df = _build_report_summary(
+        report_period=report_period, timestamp_format=timestamp_format, generated_timestamp=generated_timestamp
+    )
+    final_tag_df_results: Dict[str, pd.DataFrame] = {
+        "report_summary": report_summary_df,
+        "tag_summary": all_tag_summary_df,
+    }
+    tag_specific_df_results = _split_transactions_by_tag(
+        all_transactions_df=all_transactions_df,
+        timestamp_format=timestamp_format,
+        tags_to_be_analysed=tags_to_be_analysed,
+    )
+    for df_name, df in tag_specific_df_results.items():
+        final_tag_df_results[df_name] = df
+    report_file = output_dfs_to_excel(
+        df_list=final_tag_df_results, output_dir=output_dir, filename=output_filename, segment_size=segment_size
+    )
+    return report_file
+
+
 def perform_all_tag_account_analysis(
     account_name: str,
-    start_timestamp: str,
-    end_timestamp: str,
+    start_timestamp: str | datetime,
+    end_timestamp: str | datetime,
     timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT,
     output_dir: str = OUTPUT_DIR,
     output_filename: str = "all_tag_based_analysis.xlsx",
     generated_timestamp: str = TIMESTAMP,
+    segment_size: int = 250_000,
 ) -> Tuple[str, pd.DataFrame]:
     """Perform an account-wide, tag-based analysis for the specified time period and save to an Excel file.
 
@@ -155,8 +459,10 @@ def perform_all_tag_account_analysis(
 
     Args:
         account_name:  The account name to perform the analysis on.
-        start_timestamp: The start timestamp range for which you want to perform the analysis.
-        end_timestamp: The end timestamp range for which you want to perform the analysis.
+        start_timestamp: The start timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
+        end_timestamp: The end timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
         timestamp_format: The timestamp format for the supplied start and end timestamps.
             Defaults to DEFAULT_TIMESTAMP_FORMAT.
         output_dir: The output directory to save the reports to.
@@ -166,76 +472,38 @@ def perform_all_tag_account_analysis(
         generated_timestamp: The timestamp which should be added for reporting purposes, so we know when the
         report was triggered.
             Defaults to TIMESTAMP.
+        segment_size: The maximum number of transactions to be written to a single worksheet. Any tag with more
+        transactions is split across multiple worksheets, suffixed with "_part<n>".
+            Defaults to 250,000.
 
     Returns:
         report_file: The Excel report file path which contains the results.
         all_tag_summary_df: The summary dataframe which contains the tag spend summary.
     """
-    up_bank_client = initialise_up_bank_client()
-    account_data = filter_by_account_name(up_bank_client=up_bank_client, account_name=account_name)
-    if not account_data:
-        logger.critical(
-            f"Unable to retrieve account name: {account_name} and it's account_id attribute."
-            " Please check that your account name is correct and try again."
-        )
-        sys.exit(2)
-    else:
-        account_id = account_data.id
-    up_bank_account = retrieve_specific_account(account_id=account_id, up_bank_client=up_bank_client)
-    start_time = datetime.strptime(start_timestamp, timestamp_format)
-    end_time = datetime.strptime(end_timestamp, timestamp_format)
-    time_difference_in_days, time_difference_in_weeks, time_difference_in_months = (
-        calculate_time_periods_between_two_dates(start_time=start_time, end_time=end_time)
+    up_bank_account = _get_account_context(account_name=account_name).account
+    report_period = _parse_period(
+        start_timestamp=start_timestamp, end_timestamp=end_timestamp, timestamp_format=timestamp_format
     )
-    all_transactions = retrieve_transactions_from_account(
-        up_bank_account=up_bank_account, since=start_time, until=end_time
+    all_tag_summary_df, all_transactions_df = _compute_tag_summary(
+        up_bank_account=up_bank_account, report_period=report_period
+    )
+    report_file = _write_tag_report(
+        all_tag_summary_df=all_tag_summary_df,
+        all_transactions_df=all_transactions_df,
+        report_period=report_period,
+        timestamp_format=timestamp_format,
+        generated_timestamp=generated_timestamp,
+        output_dir=output_dir,
+        output_filename=output_filename,
+        segment_size=segment_size,
     )
-    all_transactions_df = convert_transactions_to_df(up_bank_transactions=all_transactions)
-    all_tags = all_transactions_df["tags"].unique()
-    all_tag_summary_data: List[Dict[str, Any]] = []
-    tag_specific_df_results: Dict[str, pd.DataFrame] = {}
-    for tag in all_tags:
-        filtered_tag_df = filter_transactions_by_tag(df=all_transactions_df, tag=tag)
-        filtered_tag_df.loc[:, ("settled_at")] = filtered_tag_df["settled_at"].apply(convert_datetime_to_string)
-        filtered_tag_df.loc[:, ("created_at")] = filtered_tag_df["created_at"].apply(convert_datetime_to_string)
-        tag_specific_df_results[tag] = filtered_tag_df
-        total_tag_spend = filtered_tag_df["amount"].sum()
-        total_tag_spend = abs(total_tag_spend)
-        tag_weekly_spend = total_tag_spend / time_difference_in_weeks
-        tag_monthly_spend = total_tag_spend / time_difference_in_months
-        tag_summary_data: Dict[str, Any] = {
-            "tag": tag,
-            "total_spend": total_tag_spend,
-            "weekly_spend": tag_weekly_spend,
-            "monthly_spend": tag_monthly_spend,
-        }
-        logger.info(f"Tag analysis data: {tag_summary_data}")
-        all_tag_summary_data.append(tag_summary_data)
-    report_summary_dict: Dict[str, Any] = {
-        "from_timestamp": [start_timestamp],
-        "to_timestamp": [end_timestamp],
-        "generated_at": [generated_timestamp],
-        "total_days": [time_difference_in_days],
-        "total_weeks": [time_difference_in_weeks],
-        "total_months": [time_difference_in_months],
-    }
-    report_summary_df = pd.DataFrame(report_summary_dict)
-    all_tag_summary_df = pd.DataFrame(all_tag_summary_data)
-    all_tag_summary_df = all_tag_summary_df.sort_values(by=["total_spend"], ascending=False)
-    final_tag_df_results: Dict[str, pd.DataFrame] = {
-        "report_summary": report_summary_df,
-        "tag_summary": all_tag_summary_df,
-    }
-    for df_name, df in tag_specific_df_results.items():
-        final_tag_df_results[df_name] = df
-    report_file = output_dfs_to_excel(df_list=final_tag_df_results, output_dir=output_dir, filename=output_filename)
     return report_file, all_tag_summary_df
 
 
 def perform_tag_account_analysis(
     account_name: str,
-    start_timestamp: str,
-    end_timestamp: str,
+    start_timestamp: str | datetime,
+    end_timestamp: str | datetime,
     tags_to_be_analysed: List[str],
     timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT,
     output_dir: str = OUTPUT_DIR,
@@ -246,8 +514,10 @@ def perform_tag_account_analysis(
 
     Args:
         account_name:  The account name to perform the analysis on.
-        start_timestamp: The start timestamp range for which you want to perform the analysis.
-        end_timestamp: The end timestamp range for which you want to perform the analysis.
+        start_timestamp: The start timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
+        end_timestamp: The end timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
         tags_to_be_analysed: A list of tags to perform the analysis on.
         timestamp_format: The timestamp format for the supplied start and end timestamps.
             Defaults to DEFAULT_TIMESTAMP_FORMAT.
@@ -264,70 +534,30 @@ def perform_tag_account_analysis(
         report_file: The Excel report file path which contains the results.
         all_tag_summary_df: The summary dataframe which contains the tag spend summary.
     """
-    up_bank_client = initialise_up_bank_client()
-    account_data = filter_by_account_name(up_bank_client=up_bank_client, account_name=account_name)
-    if not account_data:
-        logger.critical(
-            f"Unable to retrieve account name: {account_name} and it's account_id attribute."
-            " Please check that your account name is correct and try again."
-        )
-        sys.exit(2)
-    else:
-        account_id = account_data.id
-    up_bank_account = retrieve_specific_account(account_id=account_id, up_bank_client=up_bank_client)
-    start_time = datetime.strptime(start_timestamp, timestamp_format)
-    end_time = datetime.strptime(end_timestamp, timestamp_format)
-    time_difference_in_days, time_difference_in_weeks, time_difference_in_months = (
-        calculate_time_periods_between_two_dates(start_time=start_time, end_time=end_time)
+    up_bank_account = _get_account_context(account_name=account_name).account
+    report_period = _parse_period(
+        start_timestamp=start_timestamp, end_timestamp=end_timestamp, timestamp_format=timestamp_format
     )
-    all_transactions = retrieve_transactions_from_account(
-        up_bank_account=up_bank_account, since=start_time, until=end_time
+    all_tag_summary_df, all_transactions_df = _compute_tag_summary(
+        up_bank_account=up_bank_account, report_period=report_period, tags_to_be_analysed=tags_to_be_analysed
+    )
+    report_file = _write_tag_report(
+        all_tag_summary_df=all_tag_summary_df,
+        all_transactions_df=all_transactions_df,
+        report_period=report_period,
+        timestamp_format=timestamp_format,
+        generated_timestamp=generated_timestamp,
+        output_dir=output_dir,
+        output_filename=output_filename,
+        tags_to_be_analysed=tags_to_be_analysed,
     )
-    all_transactions_df = convert_transactions_to_df(up_bank_transactions=all_transactions)
-    all_tag_summary_data: List[Dict[str, Any]] = []
-    tag_specific_df_results: Dict[str, pd.DataFrame] = {}
-    for tag in tags_to_be_analysed:
-        filtered_tag_df = filter_transactions_by_tag(df=all_transactions_df, tag=tag)
-        filtered_tag_df.loc[:, ("settled_at")] = filtered_tag_df["settled_at"].apply(convert_datetime_to_string)
-        filtered_tag_df.loc[:, ("created_at")] = filtered_tag_df["created_at"].apply(convert_datetime_to_string)
-        tag_specific_df_results[tag] = filtered_tag_df
-        total_tag_spend = filtered_tag_df["amount"].sum()
-        total_tag_spend = abs(total_tag_spend)
-        tag_weekly_spend = total_tag_spend / time_difference_in_weeks
-        tag_monthly_spend = total_tag_spend / time_difference_in_months
-        tag_summary_data: Dict[str, Any] = {
-            "tag": tag,
-            "total_spend": total_tag_spend,
-            "weekly_spend": tag_weekly_spend,
-            "monthly_spend": tag_monthly_spend,
-        }
-        logger.info(f"Tag analysis data: {tag_summary_data}")
-        all_tag_summary_data.append(tag_summary_data)
-    report_summary_dict: Dict[str, Any] = {
-        "from_timestamp": [start_timestamp],
-        "to_timestamp": [end_timestamp],
-        "generated_at": [generated_timestamp],
-        "total_days": [time_difference_in_days],
-        "total_weeks": [time_difference_in_weeks],
-        "total_months": [time_difference_in_months],
-    }
-    report_summary_df = pd.DataFrame.from_dict(report_summary_dict)
-    all_tag_summary_df = pd.DataFrame(all_tag_summary_data)
-    all_tag_summary_df = all_tag_summary_df.sort_values(by=["total_spend"], ascending=False)
-    final_tag_df_results: Dict[str, pd.DataFrame] = {
-        "report_summary": report_summary_df,
-        "tag_summary": all_tag_summary_df,
-    }
-    for df_name, df in tag_specific_df_results.items():
-        final_tag_df_results[df_name] = df
-    report_file = output_dfs_to_excel(df_list=final_tag_df_results, output_dir=output_dir, filename=output_filename)
     return report_file, all_tag_summary_df
 
 
 def perform_budget_versus_spend_tag_analysis(
     account_name: str,
-    start_timestamp: str,
-    end_timestamp: str,
+    start_timestamp: str | datetime,
+    end_timestamp: str | datetime,
     input_budget_dir: str,
     input_filename: str,
     output_dir: str = OUTPUT_DIR,
@@ -341,8 +571,10 @@ def perform_budget_versus_spend_tag_analysis(
 
     Args:
         account_name:  The account name to perform the analysis on.
-        start_timestamp: The start timestamp range for which you want to perform the analysis.
-        end_timestamp: The end timestamp range for which you want to perform the analysis.
+        start_timestamp: The start timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
+        end_timestamp: The end timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
         input_budget_dir: The input directory which contains budget file.
         input_filename: The input CSV filename.
         output_dir: The output directory to save the reports to.
@@ -364,38 +596,30 @@ def perform_budget_versus_spend_tag_analysis(
     Returns:
         report_file: The Excel report file path which contains the results.
     """
-    _, all_tag_summary_df = perform_all_tag_account_analysis(
-        account_name=account_name, end_timestamp=end_timestamp, start_timestamp=start_timestamp
+    up_bank_account = _get_account_context(account_name=account_name).account
+    report_period = _parse_period(
+        start_timestamp=start_timestamp, end_timestamp=end_timestamp, timestamp_format=timestamp_format
     )
+    # NOTE: Only the tag spend summary is required, the per-tag transactions aren't written to this report.
+    all_tag_summary_df, _ = _compute_tag_summary(up_bank_account=up_bank_account, report_period=report_period)
     budget_df = load_csv_budget_to_df(input_dir=input_budget_dir, input_filename=input_filename)
-    budget_spend_merged_df = pd.merge(left=all_tag_summary_df, right=budget_df, on="tag", how="left")
+    # Look up each tag's budget against the budget indexed by tag, rather than merging the two dataframes.
+    # NOTE: Any budget columns which clash with the tag summary's columns are suffixed, as pd.merge would do.
+    budget_spend_merged_df = all_tag_summary_df.join(
+        budget_df.set_index("tag"), on="tag", lsuffix="_x", rsuffix="_y"
+    ).reset_index(drop=True)
     budget_spend_df = calculate_weekly_budget_variance(
         df=budget_spend_merged_df, upper_variance_limit=upper_variance_limit, lower_variance_limit=lower_variance_limit
     )
     # NOTE: Dropping the 'monthly_spend' column as the current budget tracker is based on a 'weekly_budget" amount.
     # If you  wanted to adjust your budgeting to monthly, you could define your own "monthly_budget" key and
     # write your own calculate_monthly_budget_variance function
-    budget_columns = budget_spend_df.columns.to_list()
-    for column in budget_columns:
-        logger.critical(f"Column Name: {column}")
-    logger.critical(f"Columns: {budget_spend_df.columns.to_list()}")
-
+    logger.debug("Budget versus spend columns: %s", budget_spend_df.columns.to_list())
     if "weekly_budget_variance" in budget_spend_df.columns.to_list():
-        budget_spend_merged_df = budget_spend_df.drop(columns=["monthly_spend"])
-    start_time = datetime.strptime(start_timestamp, timestamp_format)
-    end_time = datetime.strptime(end_timestamp, timestamp_format)
-    time_difference_in_days, time_difference_in_weeks, time_difference_in_months = (
-        calculate_time_periods_between_two_dates(start_time=start_time, end_time=end_time)
+        budget_spend_merged_df = budget_spend_df.drop(columns=["monthly_spend"], errors="ignore")
+    report_summary_df = _build_report_summary(
+        report_period=report_period, timestamp_format=timestamp_format, generated_timestamp=generated_timestamp
     )
-    report_summary_dict: Dict[str, Any] = {
-        "from_timestamp": [start_timestamp],
-        "to_timestamp": [end_timestamp],
-        "generated_at": [generated_timestamp],
-        "total_days": [time_difference_in_days],
-        "total_weeks": [time_difference_in_weeks],
-        "total_months": [time_difference_in_months],
-    }
-    report_summary_df = pd.DataFrame.from_dict(report_summary_dict)
     df_list: Dict[str, pd.DataFrame] = {
         "report_summary": report_summary_df,
         "budget_vs_spend": budget_spend_df,
@@ -406,8 +630,8 @@ def perform_budget_versus_spend_tag_analysis(
 
 def retrieve_untagged_withdrawals(
     account_name: str,
-    start_timestamp: str,
-    end_timestamp: str,
+    start_timestamp: str | datetime,
+    end_timestamp: str | datetime,
     output_dir: str,
     output_filename: str = OUTPUT_DIR,
     timestamp_format: str = DEFAULT_TIMESTAMP_FORMAT,
@@ -417,8 +641,10 @@ def retrieve_untagged_withdrawals(
 
     Args:
         account_name:  The account name to perform the analysis on.
-        start_timestamp: The start timestamp range for which you want to perform the analysis.
-        end_timestamp: The end timestamp range for which you want to perform the analysis.
+        start_timestamp: The start timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
+        end_timestamp: The end timestamp range for which you want to perform the analysis. This can either be a
+        string in the timestamp_format, or an already parsed datetime object.
         output_dir: The output directory to save the reports to.
             Defaults to OUTPUT_DIR.
         output_filename: The output filename to save the reports to.
@@ -432,43 +658,25 @@ def retrieve_untagged_withdrawals(
     Returns:
         report_file: The Excel report file path which contains the results.
     """
-    up_bank_client = initialise_up_bank_client()
-    account_data = filter_by_account_name(up_bank_client=up_bank_client, account_name=account_name)
-    if not account_data:
-        logger.critical(
-            f"Unable to retrieve account name: {account_name} and it's account_id attribute."
-            " Please check that your account name is correct and try again."
-        )
-        sys.exit(2)
-    else:
-        account_id = account_data.id
-    up_bank_account = retrieve_specific_account(account_id=account_id, up_bank_client=up_bank_client)
-    start_time = datetime.strptime(start_timestamp, timestamp_format)
-    end_time = datetime.strptime(end_timestamp, timestamp_format)
-    time_difference_in_days, time_difference_in_weeks, time_difference_in_months = (
-        calculate_time_periods_between_two_dates(start_time=start_time, end_time=end_time)
+    up_bank_account = _get_account_context(account_name=account_name).account
+    report_period = _parse_period(
+        start_timestamp=start_timestamp, end_timestamp=end_timestamp, timestamp_format=timestamp_format
     )
-    all_transactions = retrieve_transactions_from_account(
-        up_bank_account=up_bank_account, since=start_time, until=end_time
+    # Pass the transactions straight through to the conversion, so the transaction objects can be released as soon
+    # as they've been converted into the dataframe's columns.
+    all_transactions_df = convert_transactions_to_df(
+        up_bank_transactions=retrieve_transactions_from_account(
+            up_bank_account=up_bank_account, since=report_period.start_time, until=report_period.end_time
+        )
     )
-    all_transactions_df = convert_transactions_to_df(up_bank_transactions=all_transactions)
-    withdrawals_df = filter_transactions_by_withdrawals_only(df=all_transactions_df)
-    untagged_withdrawals_df = filter_transactions_with_empty_tag(df=withdrawals_df)
-    untagged_withdrawals_df.loc[:, ("settled_at")] = untagged_withdrawals_df["settled_at"].apply(
-        convert_datetime_to_string
+    untagged_withdrawals_df = filter_transactions_by_untagged_withdrawals(df=all_transactions_df)
+    untagged_withdrawals_df = untagged_withdrawals_df.assign(
+        settled_at=_format_datetime_column(untagged_withdrawals_df["settled_at"]),
+        created_at=_format_datetime_column(untagged_withdrawals_df["created_at"]),
     )
-    untagged_withdrawals_df.loc[:, ("created_at")] = untagged_withdrawals_df["created_at"].apply(
-        convert_datetime_to_string
+    report_summary_df = _build_report_summary(
+        report_period=report_period, timestamp_format=timestamp_format, generated_timestamp=generated_timestamp
     )
-    report_summary_dict: Dict[str, Any] = {
-        "from_timestamp": [start_timestamp],
-        "to_timestamp": [end_timestamp],
-        "generated_at": [generated_timestamp],
-        "total_days": [time_difference_in_days],
-        "total_weeks": [time_difference_in_weeks],
-        "total_months": [time_difference_in_months],
-    }
-    report_summary_df = pd.DataFrame.from_dict(report_summary_dict)
     df_list: Dict[str, pd.DataFrame] = {
         "report_summary": report_summary_df,
         "untagged_withdrawals": untagged_withdrawals_df,
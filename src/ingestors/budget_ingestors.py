@@ -2,16 +2,39 @@
 
 import json
 import os
+from functools import lru_cache
 from typing import Any, Dict, List
 
 import pandas as pd
 
 from src.shared.logging.logger import InternalLogger  # noqa
-from src.shared.settings import DEFAULT_LOG_FILE
+from src.shared.settings import DEFAULT_LOG_FILE, INPUT_DIR, INPUT_DIR_RESOLVED
 
 # Setting logging level to informational
 log_level = "INFO"
-logger = InternalLogger(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="budget_ingestors")
+logger = InternalLogger.get(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="budget_ingestors")
+
+# The column types of a budget CSV file, so they don't need to be inferred when the file is read.
+# NOTE: The 'weekly_budget' column is kept as a float64, to avoid introducing rounding errors into the budget amounts.
+# NOTE: The 'tag' column uses the nullable "string" dtype, so that a blank tag is read as NA by both engines (with a
+# dtype of str, the pyarrow engine reads a blank tag as the string "None").
+BUDGET_CSV_DTYPES: Dict[str, Any] = {"tag": "string", "weekly_budget": "float64"}
+
+
+def _build_input_file_path(input_dir: str, file_name: str) -> str:
+    """Build the path of an input file.
+
+    Args:
+        input_dir: The input directory of the file.
+        file_name: The name of the file.
+
+    Returns:
+        file_path: The path to the file.
+    """
+    # Re-use the already resolved input directory when the default is in use, rather than resolving it again.
+    if input_dir == INPUT_DIR:
+        return os.fspath(INPUT_DIR_RESOLVED / file_name)
+    return os.path.join(input_dir, file_name)
 
 
 def load_json_budget_to_df(input_dir: str, input_filename: str) -> pd.DataFrame:
@@ -24,34 +47,84 @@ def load_json_budget_to_df(input_dir: str, input_filename: str) -> pd.DataFrame:
     Returns:
         df: The pandas dataframe containing the budget data.
     """
-    budget_file_path = os.path.join(input_dir, input_filename)
-    if not (os.path.exists(budget_file_path)):
+    budget_file_path = _build_input_file_path(input_dir=input_dir, file_name=input_filename)
+    try:
+        with open(budget_file_path) as budget_file:
+            budget_data: List[Dict[str, Any]] = json.load(budget_file)
+    except FileNotFoundError as file_err:
         error_message = f"File path doesnt exist: {budget_file_path}. Please check your inputs and try again."
         logger.critical(error_message)
-        raise FileNotFoundError(error_message)
-    with open(budget_file_path) as budget_file:
-        budget_data: List[Dict[str, Any]] = json.load(budget_file)
+        raise FileNotFoundError(error_message) from file_err
     df = pd.DataFrame(budget_data)
-    logger.info(f"Budget Data: {df.head}")
+    logger.info("Budget Data: %s", df.head)
     return df
 
 
-def load_csv_budget_to_df(input_dir: str, input_filename: str) -> pd.DataFrame:
+def load_csv_budget_to_df(input_dir: str, input_filename: str, engine: str = "c") -> pd.DataFrame:
     """Load a CSV file which contains a list of tags and the 'weekly_budget' amount..
 
     Args:
         input_dir: The input directory which contains budget file.
         input_filename: The input CSV filename.
+        engine: The pandas CSV parser engine used to read the file, either "c" or "pyarrow".
+        NOTE: "pyarrow" uses Arrow's multithreaded CSV reader, but requires the optional "pyarrow" extra to be
+        installed.
+            Defaults to "c".
 
     Returns:
         _df: The pandas dataframe containing the budget data.
+
+    Raises:
+        ValueError: When an unsupported engine is supplied.
+        ImportError: When the "pyarrow" engine is selected, but pyarrow is not installed.
     """
-    budget_file_path = os.path.join(input_dir, input_filename)
-    if not (os.path.exists(budget_file_path)):
+    if engine not in ("c", "pyarrow"):
+        error_message = f"Unsupported CSV engine: {engine}. Please use either 'c' or 'pyarrow'."
+        logger.critical(error_message)
+        raise ValueError(error_message)
+    budget_file_path = _build_input_file_path(input_dir=input_dir, file_name=input_filename)
+    # NOTE: The file's modified time and size are part of the cache key, so that the file is read again if it changes.
+    try:
+        budget_file_stat = os.stat(budget_file_path)
+    except FileNotFoundError as file_err:
         error_message = f"File path doesnt exist: {budget_file_path}. Please check your inputs and try again."
         logger.critical(error_message)
-        raise FileNotFoundError(error_message)
-    with open(budget_file_path) as budget_file:
-        df = pd.read_csv(filepath_or_buffer=budget_file)
-    logger.info(f"Budget Data: {df.head}")
+        raise FileNotFoundError(error_message) from file_err
+    # Return a copy of the cached dataframe, so that changes made by the caller don't alter the cached dataframe.
+    try:
+        df = _read_csv_budget(
+            budget_file_path=budget_file_path,
+            modified_time_ns=budget_file_stat.st_mtime_ns,
+            file_size=budget_file_stat.st_size,
+            engine=engine,
+        ).copy()
+    except ImportError as import_err:
+        # NOTE: Only the "pyarrow" engine has an optional dependency, which pandas imports when the file is read.
+        error_message = (
+            "The 'pyarrow' CSV engine requires pyarrow, which is not installed. Please install the 'pyarrow' "
+            "extra (poetry install --extras pyarrow) or use the 'c' engine."
+        )
+        logger.critical(error_message)
+        raise ImportError(error_message) from import_err
+    logger.info("Budget Data: %s", df.head)
+    return df
+
+
+@lru_cache(maxsize=16)
+def _read_csv_budget(budget_file_path: str, modified_time_ns: int, file_size: int, engine: str = "c") -> pd.DataFrame:
+    """Read a budget CSV file into a dataframe, caching the result for each version of the file.
+
+    Args:
+        budget_file_path: The path to the budget CSV file.
+        modified_time_ns: The modified time of the budget CSV file in nanoseconds, used to identify the version of the
+        file.
+        file_size: The size of the budget CSV file in bytes, used to identify the version of the file.
+        engine: The pandas CSV parser engine used to read the file, either "c" or "pyarrow".
+            Defaults to "c".
+
+    Returns:
+        df: The pandas dataframe containing the budget data.
+    """
+    # NOTE: The file path is passed straight to pandas, so that the pyarrow engine can open and read the file itself.
+    df = pd.read_csv(filepath_or_buffer=budget_file_path, engine=engine, dtype=BUDGET_CSV_DTYPES)
     return df
@@ -1,6 +1,8 @@
 """Shared logging module used throughout the project."""
 
 import logging
+from functools import cache
+from typing import Any
 
 
 class InternalLogger:
@@ -36,6 +38,12 @@ class InternalLogger:
             # Create a logger object using the app_name passed into the function.
             logger = logging.getLogger(app_name)
             # Create a logger object
+        # NOTE: logging.getLogger returns the same logger for the same name, so if the logger has already been set up
+        # by an earlier InternalLogger, reuse it rather than attaching another set of handlers which would result in
+        # every message being logged multiple times.
+        if logger.handlers:
+            self.logger = logger
+            return
         # Setup the logging formatters for log and stream outputs
         log_fmt = logging.Formatter("%(asctime)s - " "%(levelname)s - " "%(name)s - " "%(message)s")
         stream_fmt = logging.Formatter("%(levelname)s - " "%(name)s - " "%(message)s")
@@ -66,13 +74,39 @@ class InternalLogger:
         logger.addHandler(s_handler)
         self.logger = logger
 
+    @classmethod
+    def get(
+        cls,
+        log_level: str,
+        log_file_name: str = "log_file_name.log",
+        app_name: str = "",
+    ) -> "InternalLogger":
+        """Retrieve a shared logger object, which is only initialised the first time it's requested.
+
+        Repeated requests for the same log_level, log_file_name and app_name return the same InternalLogger, rather
+        than opening the log file and attaching another set of handlers each time.
+
+        Args:
+            log_level: The severity logging level for all events.
+            log_file_name: The name of the log file (including file extension).
+            app_name: The application name used within the log file.
+
+        Returns:
+            logger: An initialised InternalLogger object
+
+        Raises:
+            N/A
+        """
+        return _make_logger(log_level, log_file_name, app_name)
+
     # Helpful wrapper method to access lower-level logging methods
     # For example, instead of doing InternalLogger.logger.info, we expose InternalLogger.info instead
-    def debug(self, string: str) -> None:
+    def debug(self, string: str, *args: Any) -> None:
         """Wrapper method to perform debug logging.
 
         Args:
             string: The message to be logged.
+            *args: Optional arguments which are merged into the message, only when the message is logged.
 
         Returns:
             N/A
@@ -80,13 +114,14 @@ class InternalLogger:
         Raises:
             N/A
         """
-        self.logger.debug(string)
+        self.logger.debug(string, *args)
 
-    def info(self, string: str) -> None:
+    def info(self, string: str, *args: Any) -> None:
         """Wrapper method to perform informational logging.
 
         Args:
             string: The message to be logged.
+            *args: Optional arguments which are merged into the message, only when the message is logged.
 
         Returns:
             N/A
@@ -94,13 +129,14 @@ class InternalLogger:
         Raises:
             N/A
         """
-        self.logger.info(string)
+        self.logger.info(string, *args)
 
-    def warning(self, string: str) -> None:
+    def warning(self, string: str, *args: Any) -> None:
         """Wrapper method to perform warning logging.
 
         Args:
             string: The message to be logged.
+            *args: Optional arguments which are merged into the message, only when the message is logged.
 
         Returns:
             N/A
@@ -108,13 +144,14 @@ class InternalLogger:
         Raises:
             N/A
         """
-        self.logger.warning(string)
+        self.logger.warning(string, *args)
 
-    def error(self, string: str) -> None:
+    def error(self, string: str, *args: Any) -> None:
         """Wrapper method to perform error logging.
 
         Args:
             string: The message to be logged.
+            *args: Optional arguments which are merged into the message, only when the message is logged.
 
         Returns:
             N/A
@@ -122,13 +159,14 @@ class InternalLogger:
         Raises:
             N/A
         """
-        self.logger.error(string)
+        self.logger.error(string, *args)
 
-    def critical(self, string: str) -> None:
+    def critical(self, string: str, *args: Any) -> None:
         """Wrapper method to perform critical logging.
 
         Args:
             string: The message to be logged.
+            *args: Optional arguments which are merged into the message, only when the message is logged.
 
         Returns:
             N/A
@@ -136,7 +174,22 @@ class InternalLogger:
         Raises:
             N/A
         """
-        self.logger.critical(string)
+        self.logger.critical(string, *args)
+
+
+@cache
+def _make_logger(log_level: str, log_file_name: str, app_name: str) -> InternalLogger:
+    """Initialise an InternalLogger, caching the result so each unique logger is only initialised once.
+
+    Args:
+        log_level: The severity logging level for all events.
+        log_file_name: The name of the log file (including file extension).
+        app_name: The application name used within the log file.
+
+    Returns:
+        logger: An initialised InternalLogger object
+    """
+    return InternalLogger(log_level=log_level, log_file_name=log_file_name, app_name=app_name)
 
 
 if __name__ == "__main__":
@@ -25,11 +25,18 @@ LOG_DIR = os.path.join(BASE_REPO_PATH, "logs")
 INPUT_DIR = os.path.join(BASE_REPO_PATH, "inputs")
 Path(OUTPUT_DIR).mkdir(exist_ok=True, parents=True)
 Path(LOG_DIR).mkdir(exist_ok=True, parents=True)
+# Resolve the input and output directories once, so that they don't need to be re-resolved on every import/export.
+OUTPUT_DIR_RESOLVED = Path(OUTPUT_DIR).resolve()
+INPUT_DIR_RESOLVED = Path(INPUT_DIR).resolve()
 DEFAULT_LOG_FILE = os.path.join(LOG_DIR, "up_bank_toolkit.log")
 
 
 # Time and timezone settings
 DEFAULT_TIMESTAMP_FORMAT: str = "%Y-%m-%d %H:%M:%S"
-_DEFAULT_TZ_NAME = "Australia/Sydney"
-_TIMEZONE_AWARE_TIMESTAMP: datetime = datetime.now(tz=pytz.timezone(_DEFAULT_TZ_NAME))
+DEFAULT_TZ_NAME = "Australia/Sydney"
+# Load the default timezone once, so that it can be shared rather than being looked up again by each user.
+DEFAULT_TIMEZONE = pytz.timezone(DEFAULT_TZ_NAME)
+_TIMEZONE_AWARE_TIMESTAMP: datetime = datetime.now(tz=DEFAULT_TIMEZONE)
 TIMESTAMP: str = _TIMEZONE_AWARE_TIMESTAMP.strftime(DEFAULT_TIMESTAMP_FORMAT)
+# Filename-safe variant of the TIMESTAMP, as colons and spaces are problematic in filenames on some platforms.
+FILENAME_TIMESTAMP: str = TIMESTAMP.replace(":", "-").replace(" ", "-")
@@ -1,103 +1,139 @@
 from src.shared.logging.logger import InternalLogger  # noqa
 from upbankapi.models import PaginatedList, Transaction
+import numpy as np
 import pandas as pd
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from src.shared.settings import DEFAULT_LOG_FILE
-from math import isnan
 
 
 # Setting logging level to informational
 log_level = "INFO"
-logger = InternalLogger(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="data_transformers")
+logger = InternalLogger.get(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="data_transformers")
+
+# The columns of the transactions dataframe, in the order they're presented.
+TRANSACTION_COLUMNS: Tuple[str, ...] = (
+    "created_at",
+    "description",
+    "amount",
+    "category",
+    "parent_category",
+    "tags",
+    "message",
+    "transaction_id",
+    "amount_in_base_units",
+    "card_purchase_method",
+    "card_purchase_method_card_suffix",
+    "cashback",
+    "foreign_amount",
+    "raw_text",
+    "round_up",
+    "status",
+    "settled_at",
+    "long_description",
+)
+# The columns of the transactions dataframe which only contain a handful of distinct values.
+CATEGORICAL_TRANSACTION_COLUMNS: Tuple[str, ...] = (
+    "category",
+    "parent_category",
+    "tags",
+    "card_purchase_method",
+    "card_purchase_method_card_suffix",
+    "status",
+)
+# The possible results of a budget variance check, in the order of their categorical codes.
+VARIANCE_BREACH_VALUES: List[str] = ["N/A", "YES", "NO"]
+
+
+def _get_missing_data_logger(transaction: Transaction, is_deposit: Optional[bool] = None) -> Callable[..., None]:
+    """Get the logging method to use when a transactions' nested data is missing.
 
+    Args:
+        transaction: An Up Transaction, ready to be processed.
+        is_deposit: Whether the transaction is a deposit. When not supplied, it's determined from the transaction's
+        amount.
+            Defaults to None.
+
+    Returns:
+        log_missing_data: The debug logging method for deposits, otherwise the warning logging method.
+    """
+    if is_deposit is None:
+        is_deposit = transaction.amount > 0
+    # If it's a positive transaction (a deposit, log a debug message), else it's a negative transaction (a
+    # transaction, log a warning message)
+    return logger.debug if is_deposit else logger.warning
 
-def extract_transaction_category_data(transaction: Transaction) -> Tuple[str, str]:
-    """Extract the transactions' category data, so that it can be normalised and stored in a dataframe.
+
+def _extract_category_data(transaction: Transaction, log_missing_data: Callable[..., None]) -> Tuple[str, str]:
+    """Extract the transactions' category data, logging any missing data with the supplied logging method.
 
     Args:
         transaction: An Up Transaction, ready to be processed.
+        log_missing_data: The logging method to log any missing data with.
 
     Returns:
-        transaction_category_data: The transactions' category which is stored an as attribute on the Transaction object.
-        transaction_parent_category_data: The transactions' parent category which is stored an as attribute on the
-        Transaction object.
+        transaction_category_data: The transactions' category.
+        transaction_parent_category_data: The transactions' parent category.
     """
     # Set defaults to empty string, so that we cannot extract the values, an empty value is returned.
     transaction_category_data: str = ""
     transaction_parent_category_data: str = ""
-    # Try/except block to extract category ID.
-    # NOTE: There are valid transactions which don't contain a category ID, such as deposits from other banking
-    # institutions. We catch that exception, tune it down to a debug message and this is considered normal behaviour.
-    try:
-        transaction_category_data = transaction.category.id
-    except AttributeError as attr_e:
-        if transaction.amount > 0:
-            logger.debug(
-                f"Transaction category not found for transaction description: {transaction.description}, "
-                f"setting to: '{transaction_category_data}'. Error: {attr_e}"
-            )
-        else:
-            logger.warning(
-                f"Transaction category not found for transaction description: {transaction.description}, "
-                f"setting to: '{transaction_category_data}'. Error: {attr_e}"
-            )
-    # Try/except block to extract category parent ID.
-    # NOTE: There are valid transactions which don't contain a category parent ID, such as deposits from other banking
-    # institutions. We catch that exception, tune it down to a debug message and this is considered normal behaviour.
-    try:
-        logger.debug(f"Raw Data: {transaction.category.parent.id}")
-        transaction_parent_category_data = transaction.category.parent.id
-    except AttributeError as attr_e:
-        if transaction.amount > 0:
-            logger.debug(
-                f"Transaction category not found for transaction description: {transaction.description}, "
-                f"setting to: '{transaction_category_data}'. Error: {attr_e}"
-            )
-        else:
-            logger.warning(
-                f"Transaction parent category not found for transaction description: {transaction.description},"
-                f" setting to: '{transaction_parent_category_data}'. Error: {attr_e}"
-            )
+    # NOTE: There are valid transactions which don't contain a category or a category parent, such as deposits from
+    # other banking institutions. When they're missing on a deposit, it's a debug message as this is considered normal
+    # behaviour.
+    category = getattr(transaction, "category", None)
+    parent_category = None
+    if category is not None:
+        transaction_category_data = category.id
+        parent_category = category.parent
+    else:
+        log_missing_data(
+            "Transaction category not found for transaction description: %s, setting to: '%s'.",
+            transaction.description,
+            transaction_category_data,
+        )
+    if parent_category is not None:
+        logger.debug("Raw Data: %s", parent_category.id)
+        transaction_parent_category_data = parent_category.id
+    else:
+        log_missing_data(
+            "Transaction parent category not found for transaction description: %s, setting to: '%s'.",
+            transaction.description,
+            transaction_parent_category_data,
+        )
     return transaction_category_data, transaction_parent_category_data
 
 
-def extract_transaction_tag_data(transaction: Transaction) -> str:
-    """Extract a transactions' tag data into a string of comma-seperated tags for further processing.
+def _extract_tag_data(transaction: Transaction, log_missing_data: Callable[..., None]) -> str:
+    """Extract a transactions' tag data, logging any missing data with the supplied logging method.
 
     Args:
         transaction: An Up Transaction, ready to be processed.
+        log_missing_data: The logging method to log any missing data with.
 
     Returns:
         transaction_tag_data: String representation of tags for further processing.
     """
     transaction_tag_data: str = ""
-    # Try to extract the tags attribute off the transaction
-    try:
-        transaction_tag_list_data = transaction.tags
-        logger.debug(f"Raw Data: {transaction_tag_list_data}")
-        # Unpack the list of tag IDs and join them together back into a large,single string seperated by commas
-        if transaction_tag_list_data:
-            transaction_tag_names: List[str] = []
-            for transaction_tag in transaction_tag_list_data:
-                transaction_tag_names.append(transaction_tag.id)
-            transaction_tag_data = ",".join(transaction_tag_names)
-            return transaction_tag_data
-    # NOTE: Not all transactions have a tag, so catch this exception and conditionally log a message
-    except AttributeError as attr_e:
-        # If it's a positive transaction (a deposit, log a debug message)
-        if transaction.amount > 0:
-            logger.debug(f"Transaction tags not found, setting to: '{transaction_tag_data}'. Error: {attr_e}")
-        # Else, it's a negative transaction (a transaction, log a warning message)
-        else:
-            logger.warning(f"Transaction tags not found, setting to: '{transaction_tag_data}'. Error: {attr_e}")
+    transaction_tag_list_data = getattr(transaction, "tags", None)
+    # NOTE: Not all transactions have a tag, so conditionally log a message when there are none.
+    if transaction_tag_list_data is None:
+        log_missing_data("Transaction tags not found, setting to: '%s'.", transaction_tag_data)
+        return transaction_tag_data
+    logger.debug("Raw Data: %s", transaction_tag_list_data)
+    # Unpack the list of tag IDs and join them together back into a large,single string seperated by commas
+    if transaction_tag_list_data:
+        transaction_tag_data = ",".join(transaction_tag.id for transaction_tag in transaction_tag_list_data)
     return transaction_tag_data
 
 
-def extract_transaction_card_purchase_method(transaction: Transaction) -> Tuple[str, str]:
-    """Extract a transactions' card purchase method and suffix data for further processing.
+def _extract_card_purchase_method_data(
+    transaction: Transaction, log_missing_data: Callable[..., None]
+) -> Tuple[str, str]:
+    """Extract a transactions' card purchase method and suffix data, logging any missing data with the supplied method.
 
     Args:
         transaction: An Up Transaction, ready to be processed.
+        log_missing_data: The logging method to log any missing data with.
 
     Returns:
         transaction_card_purchase_method_data: The card purchase method for further processing.
@@ -105,43 +141,113 @@ def extract_transaction_card_purchase_method(transaction: Transaction) -> Tuple[
     """
     transaction_card_purchase_method_data: str = ""
     transaction_card_purchase_suffix_data: str = ""
-    # Try to extract the card purchase method attribute off the transaction
-    try:
-        transaction_card_purchase_method_data = transaction.card_purchase_method.method
-    # NOTE: Not all transactions have a card purchase method, so catch this exception and conditionally log a message
-    except AttributeError as attr_e:
-        #  If it's a positive transaction (a deposit, log a debug message)
-        if transaction.amount > 0:
-            logger.debug(
-                "Transaction card purchase method not found, setting to: "
-                f"'{transaction_card_purchase_method_data}'. Error: {attr_e}"
-            )
-        # Else, it's a negative transaction (a transaction, log a warning message)
-        else:
-            logger.warning(
-                "Transaction card purchase method not found, setting to: "
-                f"'{transaction_card_purchase_method_data}'. Error: {attr_e}"
-            )
-    # NOTE: Not all transactions have a card purchase suffix, so catch this exception and conditionally log a message
-    # Try to extract the card purchase suffix method attribute off the transaction
-    try:
-        transaction_card_purchase_suffix_data = transaction.card_purchase_method.card_suffix
-    except AttributeError as attr_e:
-        #  If it's a positive transaction (a deposit, log a debug message)
-        if transaction.amount > 0:
-            logger.debug(
-                "Transaction card purchase card suffix not found, setting to: "
-                f"'{transaction_card_purchase_suffix_data}'. Error: {attr_e}"
-            )
-        # Else, it's a negative transaction (a transaction, log a warning message)
-        else:
-            logger.warning(
-                "Transaction card purchase card suffix not found, setting to: "
-                f"'{transaction_card_purchase_suffix_data}'. Error: {attr_e}"
-            )
+    # NOTE: Not all transactions have a card purchase method or a card purchase suffix, so conditionally log a message
+    # when either of them are missing.
+    card_purchase_method = getattr(transaction, "card_purchase_method", None)
+    if card_purchase_method is not None:
+        transaction_card_purchase_method_data = card_purchase_method.method
+        transaction_card_purchase_suffix_data = card_purchase_method.card_suffix
+    else:
+        log_missing_data(
+            "Transaction card purchase method not found, setting to: '%s'.", transaction_card_purchase_method_data
+        )
+        log_missing_data(
+            "Transaction card purchase card suffix not found, setting to: '%s'.", transaction_card_purchase_suffix_data
+        )
     return transaction_card_purchase_method_data, transaction_card_purchase_suffix_data
 
 
+def extract_transaction_category_data(transaction: Transaction, is_deposit: Optional[bool] = None) -> Tuple[str, str]:
+    """Extract the transactions' category data, so that it can be normalised and stored in a dataframe.
+
+    Args:
+        transaction: An Up Transaction, ready to be processed.
+        is_deposit: Whether the transaction is a deposit, which determines whether missing data is logged as a debug or
+        a warning message. When not supplied, it's determined from the transaction's amount.
+            Defaults to None.
+
+    Returns:
+        transaction_category_data: The transactions' category which is stored an as attribute on the Transaction object.
+        transaction_parent_category_data: The transactions' parent category which is stored an as attribute on the
+        Transaction object.
+    """
+    log_missing_data = _get_missing_data_logger(transaction=transaction, is_deposit=is_deposit)
+    return _extract_category_data(transaction=transaction, log_missing_data=log_missing_data)
+
+
+def extract_transaction_tag_data(transaction: Transaction, is_deposit: Optional[bool] = None) -> str:
+    """Extract a transactions' tag data into a string of comma-seperated tags for further processing.
+
+    Args:
+        transaction: An Up Transaction, ready to be processed.
+        is_deposit: Whether the transaction is a deposit, which determines whether missing data is logged as a debug or
+        a warning message. When not supplied, it's determined from the transaction's amount.
+            Defaults to None.
+
+    Returns:
+        transaction_tag_data: String representation of tags for further processing.
+    """
+    log_missing_data = _get_missing_data_logger(transaction=transaction, is_deposit=is_deposit)
+    return _extract_tag_data(transaction=transaction, log_missing_data=log_missing_data)
+
+
+def extract_transaction_card_purchase_method(
+    transaction: Transaction, is_deposit: Optional[bool] = None
+) -> Tuple[str, str]:
+    """Extract a transactions' card purchase method and suffix data for further processing.
+
+    Args:
+        transaction: An Up Transaction, ready to be processed.
+        is_deposit: Whether the transaction is a deposit, which determines whether missing data is logged as a debug or
+        a warning message. When not supplied, it's determined from the transaction's amount.
+            Defaults to None.
+
+    Returns:
+        transaction_card_purchase_method_data: The card purchase method for further processing.
+        transaction_card_purchase_suffix_data: The card purchase suffix data for further processing.
+    """
+    log_missing_data = _get_missing_data_logger(transaction=transaction, is_deposit=is_deposit)
+    return _extract_card_purchase_method_data(transaction=transaction, log_missing_data=log_missing_data)
+
+
+def extract_transaction_nested_data(
+    transaction: Transaction, is_deposit: Optional[bool] = None
+) -> Tuple[str, str, str, str, str]:
+    """Extract all of a transactions' nested data for further processing.
+
+    This is equivalent to calling extract_transaction_category_data, extract_transaction_tag_data and
+    extract_transaction_card_purchase_method, but only works out how to log any missing data once.
+
+    Args:
+        transaction: An Up Transaction, ready to be processed.
+        is_deposit: Whether the transaction is a deposit, which determines whether missing data is logged as a debug or
+        a warning message. When not supplied, it's determined from the transaction's amount.
+            Defaults to None.
+
+    Returns:
+        transaction_category_data: The transactions' category.
+        transaction_parent_category_data: The transactions' parent category.
+        transaction_tag_data: String representation of the transactions' tags.
+        transaction_card_purchase_method_data: The card purchase method.
+        transaction_card_purchase_suffix_data: The card purchase suffix data.
+    """
+    log_missing_data = _get_missing_data_logger(transaction=transaction, is_deposit=is_deposit)
+    transaction_category_data, transaction_parent_category_data = _extract_category_data(
+        transaction=transaction, log_missing_data=log_missing_data
+    )
+    transaction_tag_data = _extract_tag_data(transaction=transaction, log_missing_data=log_missing_data)
+    transaction_card_purchase_method_data, transaction_card_purchase_suffix_data = _extract_card_purchase_method_data(
+        transaction=transaction, log_missing_data=log_missing_data
+    )
+    return (
+        transaction_category_data,
+        transaction_parent_category_data,
+        transaction_tag_data,
+        transaction_card_purchase_method_data,
+        transaction_card_purchase_suffix_data,
+    )
+
+
 def convert_transactions_to_df(up_bank_transactions: PaginatedList[Transaction]) -> pd.DataFrame:
     """Convert a list of Up Bank transactions into a Pandas dataframe.
 
@@ -151,41 +257,49 @@ def convert_transactions_to_df(up_bank_transactions: PaginatedList[Transaction])
     Returns:
         all_transactions_df: Pandas dataframe, containing normalised data about each transaction.
     """
-    all_transactions: List[Dict[str, Any]] = []
+    # Build the dataframe column by column, appending each transaction's values to the matching column buffer as
+    # the transactions are streamed from the API, rather than building an intermediate dictionary per transaction.
+    # NOTE: The buffers start out as lists, but some are converted into typed arrays or categoricals once filled.
+    transaction_columns: Dict[str, Any] = {column: [] for column in TRANSACTION_COLUMNS}
     for transaction in up_bank_transactions:
+        amount = transaction.amount
+        is_deposit = amount > 0
         # Extract and normalise the values from the various elements of a transaction which have nested data.
-        transaction_category_data, transaction_parent_category_data = extract_transaction_category_data(
-            transaction=transaction
-        )
-        transaction_tag_data = extract_transaction_tag_data(transaction=transaction)
-        transaction_card_purchase_method_data, transaction_card_purchase_suffix_data = (
-            extract_transaction_card_purchase_method(transaction=transaction)
-        )
-        # Build the dictionary of transaction data.
-        transaction_data: Dict[str, Any] = {
-            "created_at": transaction.created_at,
-            "description": transaction.description,
-            "amount": transaction.amount,
-            "category": transaction_category_data,
-            "parent_category": transaction_parent_category_data,
-            "tags": transaction_tag_data,
-            "message": transaction.message,
-            "transaction_id": transaction.id,
-            "amount_in_base_units": transaction.amount_in_base_units,
-            "card_purchase_method": transaction_card_purchase_method_data,
-            "card_purchase_method_card_suffix": transaction_card_purchase_suffix_data,
-            "cashback": str(transaction.cashback),
-            "foreign_amount": str(transaction.foreign_amount),
-            "raw_text": transaction.raw_text,
-            "round_up": str(transaction.round_up),
-            "status": transaction.status,
-            "settled_at": transaction.settled_at,
-            "long_description": transaction.long_description,
-        }
-        all_transactions.append(transaction_data)
-    # Convert list of transactions into a dataframe.
-    all_transactions_df = pd.DataFrame(all_transactions)
-    logger.info(f"Converted {len(all_transactions_df.index)} transactions to Pandas dataframe.")
+        (
+            transaction_category_data,
+            transaction_parent_category_data,
+            transaction_tag_data,
+            transaction_card_purchase_method_data,
+            transaction_card_purchase_suffix_data,
+        ) = extract_transaction_nested_data(transaction=transaction, is_deposit=is_deposit)
+        transaction_columns["created_at"].append(transaction.created_at)
+        transaction_columns["description"].append(transaction.description)
+        transaction_columns["amount"].append(amount)
+        transaction_columns["category"].append(transaction_category_data)
+        transaction_columns["parent_category"].append(transaction_parent_category_data)
+        transaction_columns["tags"].append(transaction_tag_data)
+        transaction_columns["message"].append(transaction.message)
+        transaction_columns["transaction_id"].append(transaction.id)
+        transaction_columns["amount_in_base_units"].append(transaction.amount_in_base_units)
+        transaction_columns["card_purchase_method"].append(transaction_card_purchase_method_data)
+        transaction_columns["card_purchase_method_card_suffix"].append(transaction_card_purchase_suffix_data)
+        transaction_columns["cashback"].append(str(transaction.cashback))
+        transaction_columns["foreign_amount"].append(str(transaction.foreign_amount))
+        transaction_columns["raw_text"].append(transaction.raw_text)
+        transaction_columns["round_up"].append(str(transaction.round_up))
+        transaction_columns["status"].append(transaction.status)
+        transaction_columns["settled_at"].append(transaction.settled_at)
+        transaction_columns["long_description"].append(transaction.long_description)
+    # Convert the column buffers into a dataframe, using typed arrays for the numeric columns.
+    transaction_columns["amount"] = np.asarray(transaction_columns["amount"], dtype="float64")
+    transaction_columns["amount_in_base_units"] = np.asarray(transaction_columns["amount_in_base_units"], dtype="int64")
+    # NOTE: The low cardinality columns, such as the tags, are stored as categoricals, as there are only a handful of
+    # distinct values across all the transactions. Grouping and filtering on them then compares small integer codes,
+    # rather than strings.
+    for column in CATEGORICAL_TRANSACTION_COLUMNS:
+        transaction_columns[column] = pd.Categorical(transaction_columns[column])
+    all_transactions_df = pd.DataFrame(transaction_columns)
+    logger.info("Converted %s transactions to Pandas dataframe.", all_transactions_df.shape[0])
     return all_transactions_df
 
 
@@ -200,14 +314,15 @@ def filter_transactions_by_tag(df: pd.DataFrame, tag: str, exact_match: bool = T
     Returns:
         df: Pandas dataframe containing transactions with the filtered tags only.
     """
-    original_df_length = len(df.index)
-    logger.debug(f"Filtering for tag: '{tag}' in {original_df_length} in transactions.")
+    original_df_length = df.shape[0]
+    logger.debug("Filtering for tag: '%s' in %s in transactions.", tag, original_df_length)
     # When the exact_match boolean is supplied only filter for exact entries, else do a contains filter.
     # Example of a contains filter:
     # A tag of "fuel" would match BOTH tags in the dataframe column of "Car fuel" and "Truck fuel"
-    df = df[df["tags"] == tag] if exact_match else df[df["tags"].str.contains(tag)]
-    final_df_length = len(df.index)
-    logger.info(f"Discovered {final_df_length} transactions with the tag: {tag}")
+    # NOTE: The contains filter matches the tag as a literal substring, rather than as a regular expression.
+    df = df[df["tags"] == tag] if exact_match else df[df["tags"].str.contains(tag, regex=False, na=False)]
+    final_df_length = df.shape[0]
+    logger.info("Discovered %s transactions with the tag: %s", final_df_length, tag)
     return df
 
 
@@ -220,13 +335,15 @@ def filter_transactions_by_withdrawals_only(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         df: Pandas dataframe containing transactions which are only withdrawals.
     """
-    original_df_length = len(df.index)
-    logger.debug(f"Filtering {original_df_length} for withdrawals")
+    original_df_length = df.shape[0]
+    logger.debug("Filtering %s for withdrawals", original_df_length)
     df = df[df["amount"] < 0.0]
-    final_df_length = len(df.index)
+    final_df_length = df.shape[0]
     logger.info(
-        f"Discovered {final_df_length} withdrawal transactions from {original_df_length} total transactions, "
-        f"removed {original_df_length - final_df_length} deposit transactions."
+        "Discovered %s withdrawal transactions from %s total transactions, removed %s deposit transactions.",
+        final_df_length,
+        original_df_length,
+        original_df_length - final_df_length,
     )
     return df
 
@@ -240,17 +357,78 @@ def filter_transactions_with_empty_tag(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         df: Pandas dataframe containing transactions which have no tags..
     """
-    original_df_length = len(df.index)
-    logger.debug(f"Filtering {original_df_length} for untagged transactions.")
-    df = df[(df["tags"].isnull()) | (df["tags"].str.len() == 0)]
-    final_df_length = len(df.index)
+    original_df_length = df.shape[0]
+    logger.debug("Filtering %s for untagged transactions.", original_df_length)
+    tags = df["tags"]
+    df = df[tags.isna() | tags.eq("")]
+    final_df_length = df.shape[0]
     logger.info(
-        f"Discovered {final_df_length} untagged transactions from {original_df_length} total transactions, "
-        f"removed {original_df_length - final_df_length} tagged transactions."
+        "Discovered %s untagged transactions from %s total transactions, removed %s tagged transactions.",
+        final_df_length,
+        original_df_length,
+        original_df_length - final_df_length,
     )
     return df
 
 
+def filter_transactions_by_untagged_withdrawals(df: pd.DataFrame) -> pd.DataFrame:
+    """Filter a pandas dataframe of transactions for withdrawals which have no tag.
+
+    This is equivalent to filter_transactions_by_withdrawals_only followed by filter_transactions_with_empty_tag, but
+    builds a single combined filter, so the dataframe is only filtered once.
+
+    Args:
+        df: Pandas dataframe of transactions, ready to be filtered.
+
+    Returns:
+        df: Pandas dataframe containing withdrawal transactions which have no tags.
+    """
+    original_df_length = df.shape[0]
+    logger.debug("Filtering %s for untagged withdrawals.", original_df_length)
+    tags = df["tags"]
+    df = df[(df["amount"] < 0.0) & (tags.isna() | tags.eq(""))]
+    final_df_length = df.shape[0]
+    logger.info(
+        "Discovered %s untagged withdrawal transactions from %s total transactions, "
+        "removed %s deposit and tagged transactions.",
+        final_df_length,
+        original_df_length,
+        original_df_length - final_df_length,
+    )
+    return df
+
+
+def calculate_total_spend_by_tag(df: pd.DataFrame) -> pd.Series:
+    """Calculate the total spend of each tag in a pandas dataframe of transactions.
+
+    The totals are accumulated in a single pass over the tags' categorical codes using numpy.bincount, rather than
+    through a pandas groupby aggregation. The amounts are summed in base units (cents), which are whole numbers and
+    therefore summed exactly, before being converted back into dollars.
+
+    Args:
+        df: Pandas dataframe of transactions, where the 'tags' column is a categorical.
+
+    Returns:
+        total_tag_spend: The absolute total spend of each tag, indexed by tag in order of the tag's first transaction.
+    """
+    tags = df["tags"].cat
+    tag_codes = tags.codes.to_numpy()
+    # NOTE: Transactions without a tag have a code of -1, so are excluded from the totals.
+    tagged = tag_codes >= 0
+    tag_codes = tag_codes[tagged]
+    # NOTE: numpy.bincount accumulates its weights as float64, which represents whole numbers of cents exactly.
+    tag_totals = np.bincount(tag_codes, weights=df["amount_in_base_units"].to_numpy(dtype="float64")[tagged]) / 100
+    # Only report on the tags which have transactions, in the order of each tag's first transaction.
+    observed_tag_codes = pd.unique(tag_codes)
+    total_tag_spend = pd.Series(
+        np.abs(tag_totals[observed_tag_codes]),
+        index=tags.categories[observed_tag_codes],
+        dtype="float64",
+        name="amount",
+    )
+    return total_tag_spend
+
+
 def check_whether_budget_exceeds_variance(spend_value: float, upper_variance_limit: float) -> str:
     """Check whether a value exceeds a variance, and return a string which indicates the result.
 
@@ -271,7 +449,8 @@ def check_whether_budget_exceeds_variance(spend_value: float, upper_variance_lim
                 "" - "N/A"
     """
     variance_breach: str = ""
-    if isnan(spend_value):
+    # NOTE: NaN is the only value which isn't equal to itself, so this is a check for a missing spend value.
+    if spend_value != spend_value:
         variance_breach = "N/A"
     elif spend_value >= upper_variance_limit:
         variance_breach = "YES"
@@ -300,7 +479,8 @@ def check_whether_spend_under_accepted_variance(spend_value: float, lower_varian
                 "" - "N/A"
     """
     variance_breach: str = ""
-    if isnan(spend_value):
+    # NOTE: NaN is the only value which isn't equal to itself, so this is a check for a missing spend value.
+    if spend_value != spend_value:
         variance_breach = "N/A"
     elif spend_value <= lower_variance_limit:
         variance_breach = "YES"
@@ -329,12 +509,21 @@ def calculate_weekly_budget_variance(
     df["weekly_spend"] = df["weekly_spend"].astype(float)
     df["weekly_budget"] = df["weekly_budget"].astype(float)
     df["weekly_budget_variance"] = df["weekly_spend"] / df["weekly_budget"] * 100
-    df["weekly_budget_variance"] = df["weekly_budget_variance"].astype(float)
-    df["exceeds_variance"] = df["weekly_budget_variance"].apply(
-        lambda x: check_whether_budget_exceeds_variance(spend_value=x, upper_variance_limit=upper_variance_limit)
+    # NOTE: These are vectorised equivalents of check_whether_budget_exceeds_variance and
+    # check_whether_spend_under_accepted_variance, applied to the whole column at once rather than row by row.
+    # The missing variances (unbudgeted tags) are identified once, and shared by both classifications.
+    weekly_budget_variance = df["weekly_budget_variance"].to_numpy(dtype=np.float64)
+    missing_weekly_budget_variance = np.isnan(weekly_budget_variance)
+    # The classifications are stored as categoricals, built directly from the codes of the VARIANCE_BREACH_VALUES.
+    df["exceeds_variance"] = pd.Categorical.from_codes(
+        np.select([missing_weekly_budget_variance, weekly_budget_variance >= upper_variance_limit], [0, 1], default=2),
+        categories=VARIANCE_BREACH_VALUES,
     )
-    df["under_variance"] = df["weekly_budget_variance"].apply(
-        lambda x: check_whether_spend_under_accepted_variance(spend_value=x, lower_variance_limit=lower_variance_limit)
+    df["under_variance"] = pd.Categorical.from_codes(
+        np.select([missing_weekly_budget_variance, weekly_budget_variance <= lower_variance_limit], [0, 1], default=2),
+        categories=VARIANCE_BREACH_VALUES,
     )
-    df = df.sort_values(by=["weekly_budget"], ascending=False)
+    # NOTE: Sorting in place, as the dataframe has already been amended in place above. A stable sort keeps tags
+    # with the same budget in their existing order.
+    df.sort_values(by=["weekly_budget"], ascending=False, inplace=True, kind="stable")
     return df
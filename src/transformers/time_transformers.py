@@ -1,6 +1,7 @@
 """Time transformers."""
 
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Tuple
 
 from dateutil.relativedelta import relativedelta
@@ -10,7 +11,31 @@ from src.shared.settings import DEFAULT_LOG_FILE
 
 # Setting logging level to informational
 log_level = "INFO"
-logger = InternalLogger(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="time_transformers")
+logger = InternalLogger.get(log_level=log_level, log_file_name=DEFAULT_LOG_FILE, app_name="time_transformers")
+
+# The units which time differences are divided by, built once rather than on every calculation.
+_ONE_MINUTE: timedelta = timedelta(minutes=1)
+_ONE_DAY: timedelta = timedelta(days=1)
+_ONE_WEEK: timedelta = timedelta(weeks=1)
+# The average number of days in a month, based on a 365 day year.
+_DAYS_PER_MONTH: float = 365 / 12
+
+
+@lru_cache(maxsize=128)
+def _parse_timestamp(timestamp_as_string: str) -> datetime:
+    """Parse a timestamp string into a datetime object, caching the result for repeated timestamps.
+
+    Args:
+        timestamp_as_string: A timestamp string adhering to the string format of %Y-%m-%d %H:%M:%S
+            Example: 2023-06-08 08:58:07
+
+    Returns:
+        timestamp_as_datetime_object: The timestamp as a datetime object.
+    """
+    # NOTE: The DEFAULT_TIMESTAMP_FORMAT is an ISO 8601 timestamp with a space separator, which
+    # datetime.fromisoformat parses directly, without interpreting a format string like datetime.strptime.
+    timestamp_as_datetime_object = datetime.fromisoformat(timestamp_as_string)
+    return timestamp_as_datetime_object
 
 
 def calculate_n_hours_ago_to_timestamp(timestamp_as_string: str, hours_ago: int = 1) -> str:
@@ -27,9 +52,9 @@ def calculate_n_hours_ago_to_timestamp(timestamp_as_string: str, hours_ago: int
             Example based on above:
                 2023-06-08 07:58:07
     """
-    timestamp_as_datetime_object = datetime.strptime(timestamp_as_string, "%Y-%m-%d %H:%M:%S")
-    n_hours_ago = timestamp_as_datetime_object + relativedelta(hours=-hours_ago)
-    timestamp = n_hours_ago.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp_as_datetime_object = _parse_timestamp(timestamp_as_string=timestamp_as_string)
+    n_hours_ago = timestamp_as_datetime_object - timedelta(hours=hours_ago)
+    timestamp = n_hours_ago.isoformat(sep=" ", timespec="seconds")
     return timestamp
 
 
@@ -47,9 +72,9 @@ def calculate_n_days_ago_to_timestamp(timestamp_as_string: str, days_ago: int =
             Example based on above:
                 2023-06-07 08:58:07
     """
-    timestamp_as_datetime_object = datetime.strptime(timestamp_as_string, "%Y-%m-%d %H:%M:%S")
-    n_days_ago = timestamp_as_datetime_object + relativedelta(days=-days_ago)
-    timestamp = n_days_ago.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp_as_datetime_object = _parse_timestamp(timestamp_as_string=timestamp_as_string)
+    n_days_ago = timestamp_as_datetime_object - timedelta(days=days_ago)
+    timestamp = n_days_ago.isoformat(sep=" ", timespec="seconds")
     return timestamp
 
 
@@ -67,9 +92,9 @@ def calculate_n_weeks_ago_to_timestamp(timestamp_as_string: str, weeks_ago: int
             Example based on above:
                 2023-06-01 08:58:07
     """
-    timestamp_as_datetime_object = datetime.strptime(timestamp_as_string, "%Y-%m-%d %H:%M:%S")
-    n_weeks_ago = timestamp_as_datetime_object + relativedelta(weeks=-weeks_ago)
-    timestamp = n_weeks_ago.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp_as_datetime_object = _parse_timestamp(timestamp_as_string=timestamp_as_string)
+    n_weeks_ago = timestamp_as_datetime_object - timedelta(weeks=weeks_ago)
+    timestamp = n_weeks_ago.isoformat(sep=" ", timespec="seconds")
     return timestamp
 
 
@@ -87,9 +112,9 @@ def calculate_n_months_ago_to_timestamp(timestamp_as_string: str, months_ago: in
             Example based on above:
                 2023-05-08 08:58:07
     """
-    timestamp_as_datetime_object = datetime.strptime(timestamp_as_string, "%Y-%m-%d %H:%M:%S")
+    timestamp_as_datetime_object = _parse_timestamp(timestamp_as_string=timestamp_as_string)
     n_months_ago = timestamp_as_datetime_object + relativedelta(months=-months_ago)
-    timestamp = n_months_ago.strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = n_months_ago.isoformat(sep=" ", timespec="seconds")
     return timestamp
 
 
@@ -106,15 +131,15 @@ def calculate_time_periods_between_two_dates(start_time: datetime, end_time: dat
         time_difference_in_months: The exact time difference in months.
     """
     time_difference = end_time - start_time
-    time_difference_in_minutes = time_difference / timedelta(minutes=1)
-    time_difference_in_days = time_difference / timedelta(days=1)
-    time_difference_in_weeks = time_difference / timedelta(weeks=1)
+    time_difference_in_minutes = time_difference / _ONE_MINUTE
+    time_difference_in_days = time_difference / _ONE_DAY
+    time_difference_in_weeks = time_difference / _ONE_WEEK
     time_difference_in_months = calculate_days_to_months(days=time_difference_in_days)
-    logger.debug(f"Start Time: {start_time} - End Time: {end_time} differences are as follows:")
-    logger.debug(f"Time difference in minutes: {time_difference_in_minutes}")
-    logger.debug(f"Time difference in days: {time_difference_in_days}")
-    logger.debug(f"Time difference in weeks: {time_difference_in_weeks}")
-    logger.debug(f"Time difference in months: {time_difference_in_months}")
+    logger.debug("Start Time: %s - End Time: %s differences are as follows:", start_time, end_time)
+    logger.debug("Time difference in minutes: %s", time_difference_in_minutes)
+    logger.debug("Time difference in days: %s", time_difference_in_days)
+    logger.debug("Time difference in weeks: %s", time_difference_in_weeks)
+    logger.debug("Time difference in months: %s", time_difference_in_months)
     return time_difference_in_days, time_difference_in_weeks, time_difference_in_months
 
 
@@ -127,6 +152,5 @@ def calculate_days_to_months(days: float) -> float:
     Returns:
         months: The exact months in float representation.
     """
-    average_days_in_month: float = 365 / 12
-    months = days / average_days_in_month
+    months = days / _DAYS_PER_MONTH
     return months